@@ -4,15 +4,62 @@ Alfred-specific utilities for Alfred Git Open workflow.
 """
 import os
 import sys
-import json
-import sqlite3
+import atexit
+import re
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import TYPE_CHECKING, Iterable, List, Dict, Any, Optional, Tuple
+
+if TYPE_CHECKING:
+    import sqlite3
+
+SUBTITLE_SEPARATOR = " • "
+
+# Background colors of Alfred's dark themes
+_DARK_THEME_RE = re.compile(r'rgba\((?:0,0,0|40,40,40|20,20,20)')
+
+try:
+    # orjson serializes several times faster than json when it is installed
+    import orjson
+    
+    def encode_json(obj: Any) -> bytes:
+        """Encode obj as compact UTF-8 JSON."""
+        return orjson.dumps(obj)
+except ImportError:
+    import json
+    
+    def encode_json(obj: Any) -> bytes:
+        """Encode obj as compact UTF-8 JSON."""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+def _write_json(obj: Any) -> None:
+    """Write compact JSON to stdout as UTF-8 bytes."""
+    sys.stdout.flush()
+    sys.stdout.buffer.write(encode_json(obj))
+    sys.stdout.buffer.flush()
 
 def output(items: List[Dict[str, Any]]) -> None:
     """Create JSON output for Alfred."""
     alfred_json = {"items": items}
-    sys.stdout.write(json.dumps(alfred_json, indent=4))
+    _write_json(alfred_json)
+
+def stream_output(items: Iterable[Dict[str, Any]]) -> None:
+    """Create JSON output for Alfred, writing each item as soon as it is produced."""
+    stream_raw_output(map(encode_json, items))
+
+def stream_raw_output(encoded_items: Iterable[bytes]) -> None:
+    """Like stream_output, for items already serialized to JSON bytes."""
+    sys.stdout.flush()
+    out = sys.stdout.buffer
+    out.write(b'{"items":[')
+    separator = b''
+    for encoded_item in encoded_items:
+        out.write(separator)
+        out.write(encoded_item)
+        separator = b','
+    out.write(b']}')
+    out.flush()
 
 def error_item(title: str, subtitle: str) -> Dict[str, Any]:
     """Create an error item for Alfred output."""
@@ -43,32 +90,57 @@ def item(title: str, subtitle: str, arg: str = "", valid: bool = True,
     
     return item_dict
 
+_CLIPBOARD_SQL = "SELECT item FROM clipboard WHERE dataType=0 ORDER BY ts DESC LIMIT ?"
+_CONN: Optional["sqlite3.Connection"] = None
+
+def _get_clipboard_connection() -> Optional["sqlite3.Connection"]:
+    """Get a cached read-only connection to Alfred's clipboard database."""
+    # Imported lazily; only the clipboard workflow needs sqlite3
+    import sqlite3
+    
+    global _CONN
+    if _CONN is not None:
+        return _CONN
+    
+    # Path to Alfred's clipboard history database
+    db_path = Path.home() / "Library/Application Support/Alfred/Databases/clipboard.alfdb"
+    
+    if not db_path.exists():
+        return None
+    
+    # Open read-only; the database is owned by Alfred and never written here. Not immutable:
+    # Alfred keeps writing it, and the newest copies may still be in the WAL
+    _CONN = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True, check_same_thread=False)
+    _CONN.execute("PRAGMA query_only=1")
+    _CONN.execute("PRAGMA temp_store=MEMORY")
+    _CONN.execute("PRAGMA cache_size=-8000")
+    _CONN.execute("PRAGMA mmap_size=134217728")
+    atexit.register(_CONN.close)
+    
+    # The schema belongs to Alfred, so an index cannot be added; just report a sorting scan
+    # when debugging, without spending a query on it otherwise
+    if is_debug_enabled():
+        plan = " ".join(row[-1] for row in _CONN.execute(f"EXPLAIN QUERY PLAN {_CLIPBOARD_SQL}", (0,)))
+        if "TEMP B-TREE" in plan:
+            print_debug(f"Clipboard query is not index-backed: {plan}")
+    
+    return _CONN
+
 def get_alfred_clipboard_history(limit: int = 50) -> List[str]:
     """Get clipboard history from Alfred's database."""
     try:
-        # Path to Alfred's clipboard history database
-        db_path = Path.home() / "Library/Application Support/Alfred/Databases/clipboard.alfdb"
-        
-        if not db_path.exists():
+        conn = _get_clipboard_connection()
+        if conn is None:
             return []
         
-        # Connect to the database and query clipboard history
-        conn = sqlite3.connect(str(db_path))
-        cursor = conn.cursor()
-        
         # Query to get the most recent text entries
-        query = f"SELECT item FROM clipboard WHERE dataType = 0 ORDER BY ts DESC LIMIT {limit}"
-        cursor.execute(query)
-        
-        clipboard_items = [row[0] for row in cursor.fetchall()]
-        conn.close()
-        
-        return clipboard_items
+        return [row[0] for row in conn.execute(_CLIPBOARD_SQL, (limit,))]
     
     except Exception as e:
         print_debug(f"Error accessing clipboard history: {e}")
         return []
 
+@lru_cache(maxsize=1)
 def get_alfred_preferences_path() -> Path:
     """Get Alfred preferences path."""
     # Check for custom preferences location
@@ -79,11 +151,13 @@ def get_alfred_preferences_path() -> Path:
     # Default location
     return Path.home() / "Library/Application Support/Alfred"
 
+@lru_cache(maxsize=1)
 def get_alfred_workflow_data_path() -> Path:
     """Get Alfred workflow data directory."""
     workflow_uid = os.environ.get('alfred_workflow_uid', 'unknown')
     return get_alfred_preferences_path() / "Workflow Data" / workflow_uid
 
+@lru_cache(maxsize=1)
 def get_alfred_workflow_cache_path() -> Path:
     """Get Alfred workflow cache directory."""
     workflow_uid = os.environ.get('alfred_workflow_uid', 'unknown')
@@ -108,12 +182,19 @@ def set_alfred_variable(key: str, value: str) -> None:
 
 def log_to_alfred(message: str, level: str = "INFO") -> None:
     """Log message to Alfred's debug console."""
-    timestamp = __import__('datetime').datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    # Imported lazily; only logging needs it
+    from datetime import datetime
+    
+    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     print(f"[{timestamp}] [{level}] {message}", file=sys.stderr)
 
+def is_debug_enabled() -> bool:
+    """Check if debug output is enabled (DEBUG or alfred_debug is set)."""
+    return bool(os.environ.get('DEBUG') or os.environ.get('alfred_debug'))
+
 def print_debug(message: str) -> None:
     """Print debug message to stderr if DEBUG is set."""
-    if os.environ.get('DEBUG') or os.environ.get('alfred_debug'):
+    if is_debug_enabled():
         log_to_alfred(message, "DEBUG")
 
 def print_error(message: str) -> None:
@@ -140,6 +221,10 @@ def handle_error(title: str, subtitle: str, exit_code: int = 1) -> None:
     output([alfred_item])
     sys.exit(exit_code)
 
+def _prepare_items(items: List[Dict[str, Any]], fields: List[str]) -> List[Tuple[str, ...]]:
+    """Casefold the given fields of each item once, in a list parallel to items."""
+    return [tuple(item.get(field, '').casefold() for field in fields) for item in items]
+
 def filter_items_by_query(items: List[Dict[str, Any]], query: str, 
                          search_fields: List[str] = None) -> List[Dict[str, Any]]:
     """Filter Alfred items by query string."""
@@ -149,56 +234,47 @@ def filter_items_by_query(items: List[Dict[str, Any]], query: str,
     if search_fields is None:
         search_fields = ["title", "subtitle"]
     
-    query_lower = query.lower()
-    filtered_items = []
+    query_folded = query.casefold()
     
-    for item in items:
-        # Search in specified fields
-        match_found = False
-        for field in search_fields:
-            if field in item and query_lower in item[field].lower():
-                match_found = True
-                break
-        
-        if match_found:
-            filtered_items.append(item)
+    # Keep items where any of the specified fields contains the query
+    return [
+        item for item, folded in zip(items, _prepare_items(items, search_fields))
+        if any(query_folded in value for value in folded)
+    ]
+
+def _relevance_score(title: str, subtitle: str, query_lower: str) -> int:
+    """Score casefolded title/subtitle against a casefolded query."""
+    # Exact title match gets highest score
+    if title == query_lower:
+        return 1000
     
-    return filtered_items
+    # Title starts with query (900) or contains it (800)
+    position = title.find(query_lower)
+    if position >= 0:
+        return 900 if position == 0 else 800
+    
+    # Subtitle starts with query (700) or contains it (600)
+    position = subtitle.find(query_lower)
+    if position >= 0:
+        return 700 if position == 0 else 600
+    
+    return 0
 
 def sort_items_by_relevance(items: List[Dict[str, Any]], query: str) -> List[Dict[str, Any]]:
     """Sort items by relevance to query (title matches first, then subtitle)."""
     if not query.strip():
         return items
     
-    query_lower = query.lower()
+    query_folded = query.casefold()
     
-    def relevance_score(item):
-        title = item.get('title', '').lower()
-        subtitle = item.get('subtitle', '').lower()
-        
-        # Exact title match gets highest score
-        if title == query_lower:
-            return 1000
-        
-        # Title starts with query
-        if title.startswith(query_lower):
-            return 900
-        
-        # Title contains query
-        if query_lower in title:
-            return 800
-        
-        # Subtitle starts with query
-        if subtitle.startswith(query_lower):
-            return 700
-        
-        # Subtitle contains query
-        if query_lower in subtitle:
-            return 600
-        
-        return 0
+    # Score each item once, then sort on the precomputed scores
+    decorated = [
+        (_relevance_score(title, subtitle, query_folded), item)
+        for item, (title, subtitle) in zip(items, _prepare_items(items, ["title", "subtitle"]))
+    ]
+    decorated.sort(key=itemgetter(0), reverse=True)
     
-    return sorted(items, key=relevance_score, reverse=True)
+    return [item for _, item in decorated]
 
 def no_results_item(query: str, context: str = "items") -> Dict[str, Any]:
     """Create a standard 'no results found' item."""
@@ -214,9 +290,12 @@ def truncate_for_alfred(text: str, max_length: int = 100) -> str:
         return text
     return text[:max_length - 3] + "..."
 
-def format_alfred_subtitle(*parts: str, separator: str = " • ") -> str:
+def format_alfred_subtitle(*parts: str, separator: str = SUBTITLE_SEPARATOR) -> str:
     """Format subtitle with separator, filtering out empty parts."""
-    return separator.join(filter(None, parts))
+    # Fast path for the common two-part subtitle
+    if len(parts) == 2 and parts[0] and parts[1]:
+        return f"{parts[0]}{separator}{parts[1]}"
+    return separator.join([part for part in parts if part])
 
 def item_with_mods(title: str, subtitle: str, arg: str = "", 
                    mods: Dict[str, Dict[str, Any]] = None, **kwargs) -> Dict[str, Any]:
@@ -250,11 +329,9 @@ def get_alfred_theme_background() -> str:
     theme = os.environ.get('alfred_theme_background', 'rgba(255,255,255,0.98)')
     
     # Simple heuristic to detect dark theme
-    if 'rgba(0,0,0' in theme or 'rgba(40,40,40' in theme or 'rgba(20,20,20' in theme:
-        return 'dark'
-    else:
-        return 'light'
+    return 'dark' if _DARK_THEME_RE.search(theme) else 'light'
 
+@lru_cache(maxsize=1)
 def is_alfred_dark_mode() -> bool:
     """Check if Alfred is using dark mode."""
     return get_alfred_theme_background() == 'dark'
@@ -267,16 +344,19 @@ def script_filter_output(items: List[Dict[str, Any]],
     if variables:
         output_dict["variables"] = variables
     
-    sys.stdout.write(json.dumps(output_dict, indent=4))
+    _write_json(output_dict)
 
+@lru_cache(maxsize=1)
 def get_alfred_workflow_version() -> str:
     """Get current workflow version."""
     return os.environ.get('alfred_workflow_version', '1.0.0')
 
+@lru_cache(maxsize=1)
 def get_alfred_workflow_name() -> str:
     """Get current workflow name."""
     return os.environ.get('alfred_workflow_name', 'Unknown Workflow')
 
+@lru_cache(maxsize=1)
 def get_alfred_workflow_bundleid() -> str:
     """Get current workflow bundle ID."""
     return os.environ.get('alfred_workflow_bundleid', 'unknown.workflow')
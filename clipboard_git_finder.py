@@ -1,7 +1,12 @@
 #!/usr/bin/env python3
 import sys
-from alfred import output, error_item, item, get_alfred_clipboard_history, handle_empty_query
-from git import get_repository_name_from_url, extract_git_urls, get_domain_from_git_url
+from alfred import output, error_item, item, get_alfred_clipboard_history
+from git import get_repository_name_from_url, iter_git_urls, get_domain_from_git_url
+
+# Substrings every supported Git URL contains
+GIT_URL_MARKERS = ('git@', '://', '.git')
+# Joins clipboard entries for batch scanning; no URL pattern matches across it
+CLIPBOARD_ITEM_SEPARATOR = '\n\x00\n'
 
 def main():
     """Main execution function."""
@@ -12,19 +17,14 @@ def main():
         output([alfred_error_item])
         sys.exit(0)
     
-    # Extract Git URLs from all clipboard items
-    all_git_urls = []
-    for clipboard_item in clipboard_items:
-        git_urls = extract_git_urls(clipboard_item)
-        all_git_urls.extend(git_urls)
-    
+    # Extract Git URLs from all clipboard items in a single scan, skipping
+    # entries that cannot contain a Git URL
+    candidates = [
+        clipboard_item for clipboard_item in clipboard_items
+        if any(marker in clipboard_item for marker in GIT_URL_MARKERS)
+    ]
     # Remove duplicates while preserving order
-    unique_git_urls = []
-    seen = set()
-    for url in all_git_urls:
-        if url not in seen:
-            unique_git_urls.append(url)
-            seen.add(url)
+    unique_git_urls = list(dict.fromkeys(iter_git_urls(CLIPBOARD_ITEM_SEPARATOR.join(candidates))))
     
     if not unique_git_urls:
         not_found_item_result = error_item("No Git repository URLs found", f"Searched through {len(clipboard_items)} clipboard entries")
@@ -5,6 +5,8 @@ All settings and constants are centralized here.
 """
 
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
 
 # -----------------------------------------------------------------------------
@@ -16,22 +18,67 @@ DEFAULT_APP_SEARCH_PATHS = [
     "~/Applications"
 ]
 
+# Expanded once at import; returned as-is when APP_SEARCH_PATHS is unset
+_DEFAULT_APP_SEARCH_PATHS = tuple(Path(os.path.expanduser(path)) for path in DEFAULT_APP_SEARCH_PATHS)
+
+@lru_cache(maxsize=1)
 def get_app_search_paths():
     """Get application search paths from environment variable or defaults."""
     paths_str = os.environ.get("APP_SEARCH_PATHS", "")
     
     if paths_str:
-        paths = []
-        for path_str in paths_str.split(','):
-            path_str = path_str.strip()
-            if path_str:
-                # Expand ~ to home directory
-                expanded_path = os.path.expanduser(path_str)
-                paths.append(Path(expanded_path))
-        return paths
+        # Expand ~ to home directory, skipping empty entries
+        return tuple(
+            Path(os.path.expanduser(path_str))
+            for path_str in map(str.strip, paths_str.split(','))
+            if path_str
+        )
     else:
         # Use defaults
-        return [Path(os.path.expanduser(path)) for path in DEFAULT_APP_SEARCH_PATHS]
+        return _DEFAULT_APP_SEARCH_PATHS
+
+# Search paths are listed concurrently only when there are more than this many;
+# starting threads costs more than listing the default two directories
+APP_SCAN_PARALLEL_THRESHOLD = 4
+
+# Maximum number of search paths listed concurrently
+APP_SCAN_WORKERS = 8
+
+def _list_apps(search_path):
+    """List the lowercased .app names in a search path."""
+    try:
+        with os.scandir(search_path) as entries:
+            return [entry.name.lower() for entry in entries if entry.name.endswith(".app")]
+    except OSError:
+        return []
+
+@lru_cache(maxsize=1)
+def _installed_apps():
+    """Map each lowercased .app name to the first search path containing it."""
+    search_paths = get_app_search_paths()
+    if len(search_paths) > APP_SCAN_PARALLEL_THRESHOLD:
+        # Imported lazily; only long search path lists need it
+        from concurrent.futures import ThreadPoolExecutor
+        
+        # List each search path once, concurrently so a slow volume does not hold up the rest
+        with ThreadPoolExecutor(max_workers=min(APP_SCAN_WORKERS, len(search_paths))) as executor:
+            app_names = list(executor.map(_list_apps, search_paths))
+    else:
+        app_names = [_list_apps(search_path) for search_path in search_paths]
+    
+    apps = {}
+    for search_path, names in zip(search_paths, app_names):
+        for name in names:
+            apps.setdefault(name, search_path)
+    return apps
+
+def find_app_bundle(bundle_name):
+    """Get the full path of an app bundle (e.g. "Cursor.app") in the search paths, or None."""
+    # Names are matched case-insensitively as on default macOS filesystems
+    search_path = _installed_apps().get(bundle_name.lower())
+    if search_path is None:
+        return None
+    return str(search_path / bundle_name)
 
 # -----------------------------------------------------------------------------
 # IDEs Configuration
@@ -48,6 +95,7 @@ DEFAULT_IDES_TO_CHECK = [
     "IntelliJ IDEA Ultimate"
 ]
 
+@lru_cache(maxsize=1)
 def get_ides_to_check():
     """Get the list of IDEs to check from environment variable or defaults."""
     ides_str = os.environ.get("IDES_TO_CHECK", "")
@@ -88,6 +136,8 @@ JETBRAINS_IDES = {
     'appcode': 'AppCode.app'
 }
 
+_JETBRAINS_KEY_RE = re.compile('|'.join(map(re.escape, JETBRAINS_IDES)))
+
 # -----------------------------------------------------------------------------
 # VSCode-like IDEs Configuration  
 # -----------------------------------------------------------------------------
@@ -111,6 +161,8 @@ VSCODE_IDES = {
     }
 }
 
+_VSCODE_KEY_RE = re.compile('|'.join(map(re.escape, VSCODE_IDES)))
+
 # -----------------------------------------------------------------------------
 # Git Repository Settings
 # -----------------------------------------------------------------------------
@@ -118,6 +170,7 @@ VSCODE_IDES = {
 DEFAULT_WORKSPACE_DIR = "~/workspace"
 DEFAULT_MAX_DEPTH = 3
 
+@lru_cache(maxsize=1)
 def get_workspace_dir():
     """Get workspace directory from environment variable or default."""
     workspace_dir = os.environ.get("WORKSPACE_DIR", "")
@@ -126,6 +179,7 @@ def get_workspace_dir():
     else:
         return os.path.expanduser(DEFAULT_WORKSPACE_DIR)
 
+@lru_cache(maxsize=1)
 def get_max_depth():
     """Get max search depth from environment variable or default."""
     try:
@@ -133,42 +187,93 @@ def get_max_depth():
     except (ValueError, TypeError):
         return DEFAULT_MAX_DEPTH
 
+# -----------------------------------------------------------------------------
+# Recent Projects Settings
+# -----------------------------------------------------------------------------
+
+DEFAULT_CHECK_RECENT_PROJECTS = "1"
+
+@lru_cache(maxsize=1)
+def is_recent_projects_check():
+    """Check if recent projects should be hidden once their path is gone (CHECK_RECENT_PROJECTS=1)."""
+    return os.environ.get("CHECK_RECENT_PROJECTS", DEFAULT_CHECK_RECENT_PROJECTS).strip().lower() in ("1", "true", "yes")
+
+# -----------------------------------------------------------------------------
+# Clone Settings
+# -----------------------------------------------------------------------------
+
+DEFAULT_CLONE_FILTER = "blob:none"
+DEFAULT_SHALLOW_CLONE = "0"
+DEFAULT_CLONE_METHOD_PRIVATE = "ssh"
+DEFAULT_CLONE_METHOD_PUBLIC = "https"
+
+# Read once at import; the environment is fixed for a workflow run
+CLONE_METHOD_PRIVATE = os.environ.get("CLONE_METHOD_PRIVATE", DEFAULT_CLONE_METHOD_PRIVATE).lower()
+CLONE_METHOD_PUBLIC = os.environ.get("CLONE_METHOD_PUBLIC", DEFAULT_CLONE_METHOD_PUBLIC).lower()
+
+@lru_cache(maxsize=1)
+def get_clone_filter():
+    """Get the partial clone filter from environment variable or default (empty disables it)."""
+    return os.environ.get("CLONE_FILTER", DEFAULT_CLONE_FILTER).strip()
+
+@lru_cache(maxsize=1)
+def is_shallow_clone():
+    """Check if clones should fetch only the latest commit (SHALLOW_CLONE=1)."""
+    return os.environ.get("SHALLOW_CLONE", DEFAULT_SHALLOW_CLONE).strip().lower() in ("1", "true", "yes")
+
+@lru_cache(maxsize=1)
+def get_clone_git_args():
+    """Get the extra git clone arguments for the partial and shallow clone settings."""
+    args = []
+    if get_clone_filter():
+        args.append(f"--filter={get_clone_filter()}")
+    if is_shallow_clone():
+        args.append("--depth=1")
+    return tuple(args)
+
 # -----------------------------------------------------------------------------
 # Helper Functions
 # -----------------------------------------------------------------------------
 
-def get_ide_app_name(ide_name):
-    """Get the app name for a given IDE."""
+def _match_ide_key(pattern, ide_keys, ide_name):
+    """Return the first configured IDE key contained in the IDE name, if any."""
     ide_name_lower = ide_name.lower()
+    if not pattern.search(ide_name_lower):
+        return None
     
+    # The alternation finds the leftmost key in the name; keys keep priority in table order
+    return next(key for key in ide_keys if key in ide_name_lower)
+
+@lru_cache(maxsize=64)
+def get_ide_app_name(ide_name):
+    """Get the app name for a given IDE."""
     # Check JetBrains IDEs
-    for jetbrains_name, app_name in JETBRAINS_IDES.items():
-        if jetbrains_name in ide_name_lower:
-            return app_name
+    jetbrains_name = _match_ide_key(_JETBRAINS_KEY_RE, JETBRAINS_IDES, ide_name)
+    if jetbrains_name:
+        return JETBRAINS_IDES[jetbrains_name]
     
     # Check VSCode-like IDEs
-    for vscode_name, config in VSCODE_IDES.items():
-        if vscode_name in ide_name_lower:
-            return config['app_name']
+    vscode_name = _match_ide_key(_VSCODE_KEY_RE, VSCODE_IDES, ide_name)
+    if vscode_name:
+        return VSCODE_IDES[vscode_name]['app_name']
     
     return None
 
+@lru_cache(maxsize=64)
 def is_jetbrains_ide(ide_name):
     """Check if the IDE is a JetBrains IDE."""
-    ide_name_lower = ide_name.lower()
-    return any(jetbrains_name in ide_name_lower for jetbrains_name in JETBRAINS_IDES.keys())
+    return _match_ide_key(_JETBRAINS_KEY_RE, JETBRAINS_IDES, ide_name) is not None
 
+@lru_cache(maxsize=64)
 def is_vscode_ide(ide_name):
     """Check if the IDE is a VSCode-like IDE.""" 
-    ide_name_lower = ide_name.lower()
-    return any(vscode_name in ide_name_lower for vscode_name in VSCODE_IDES.keys())
+    return _match_ide_key(_VSCODE_KEY_RE, VSCODE_IDES, ide_name) is not None
 
+@lru_cache(maxsize=64)
 def get_vscode_config_path(ide_name):
     """Get VSCode IDE configuration path."""
-    ide_name_lower = ide_name.lower()
-    
-    for vscode_name, config in VSCODE_IDES.items():
-        if vscode_name in ide_name_lower:
-            return config['config_path']
+    vscode_name = _match_ide_key(_VSCODE_KEY_RE, VSCODE_IDES, ide_name)
+    if vscode_name:
+        return VSCODE_IDES[vscode_name]['config_path']
     
     return None
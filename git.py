@@ -3,8 +3,45 @@
 Local Git utilities for Alfred Git Open workflow.
 """
 import os
+import re
 import subprocess
-from typing import Tuple, List, Optional
+from collections import deque
+from typing import Callable, Dict, Iterator, Tuple, List, Optional
+from config import get_clone_git_args
+
+try:
+    # google-re2 scans in linear time; use it for large clipboard blobs when installed
+    import re2 as _url_re
+except ImportError:
+    _url_re = re
+
+# Enhanced Git URL patterns to support various hosting services, fused into one scan
+_GIT_URL_RE = _url_re.compile(
+    r'(?i)'
+    # HTTPS URLs - Generic pattern for any domain
+    r'https?://[a-zA-Z0-9.-]+/[a-zA-Z0-9_.-]+/[a-zA-Z0-9_.-]+(?:\.git)?(?:/\S*)?'
+    # SSH URLs with custom ports
+    r'|ssh://git@[a-zA-Z0-9.-]+(?::[0-9]+)?/[a-zA-Z0-9_.-]+/[a-zA-Z0-9_.-]+(?:\.git)?'
+    # SSH URLs - Generic pattern for any domain
+    r'|git@[a-zA-Z0-9.-]+:[a-zA-Z0-9_.-]+/[a-zA-Z0-9_.-]+(?:\.git)?'
+    # Git protocol URLs
+    r'|git://[a-zA-Z0-9.-]+/[a-zA-Z0-9_.-]+/[a-zA-Z0-9_.-]+(?:\.git)?'
+)
+
+# Config passed to git clone through the environment instead of separate git config calls
+_CLONE_GIT_CONFIG = {'protocol.version': '2'}
+
+# Characters not allowed in local directory names (macOS filesystem)
+_INVALID_LOCAL_NAME_CHARS = frozenset('/:')
+
+# Prefixes accepted by validate_git_url
+_GIT_URL_SCHEMES = ('https://', 'http://', 'git@', 'ssh://', 'git://')
+
+# git@domain:user/repo.git
+_SSH_NORMALIZE_RE = re.compile(r'git@([^:]+):(.+)')
+
+# Parsed .git/HEAD and .git/config values, keyed by (file path, mtime_ns)
+_GIT_METADATA_CACHE: Dict[Tuple[str, int], str] = {}
 
 def is_git_repository(path: str) -> bool:
     """Check if path is a Git repository."""
@@ -26,32 +63,101 @@ def init_repository(path: str) -> Tuple[bool, str]:
     except Exception as e:
         return False, f"Error initializing repository: {str(e)}"
 
-def clone_repository(git_url: str, target_path: str, branch: str = None) -> Tuple[bool, str]:
-    """Clone a Git repository."""
+def _with_git_config(env: Dict[str, str], config: Dict[str, str]) -> Dict[str, str]:
+    """Add git config entries to env via GIT_CONFIG_COUNT, after any already set."""
+    count = int(env.get('GIT_CONFIG_COUNT') or 0)
+    for offset, (key, value) in enumerate(config.items()):
+        env[f'GIT_CONFIG_KEY_{count + offset}'] = key
+        env[f'GIT_CONFIG_VALUE_{count + offset}'] = value
+    env['GIT_CONFIG_COUNT'] = str(count + len(config))
+    return env
+
+def _run_clone(cmd: List[str], env: Dict[str, str],
+               progress_callback: Optional[Callable[[str], None]] = None) -> Tuple[int, str]:
+    """Run a clone command and return its exit code and stderr output."""
+    if not progress_callback:
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, env=env)
+        return result.returncode, result.stderr
+    
+    # Stream progress line by line, keeping only the tail for error reporting
+    tail = deque(maxlen=20)
+    with subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                          text=True, bufsize=1, env=env) as proc:
+        for line in proc.stderr:
+            progress_callback(line)
+            tail.append(line)
+    return proc.returncode, ''.join(tail)
+
+def clone_repository(git_url: str, target_path: str, branch: str = None,
+                     progress_callback: Optional[Callable[[str], None]] = None) -> Tuple[bool, str]:
+    """Clone a Git repository, passing progress lines to progress_callback if given."""
     try:
         cmd = ['git', 'clone']
         
+        if progress_callback:
+            cmd.append('--progress')
+        
         if branch:
             cmd.extend(['-b', branch])
         
+        # Partial and shallow clone settings, shared with the gh clone paths
+        cmd.extend(get_clone_git_args())
+        
         cmd.extend([git_url, target_path])
         
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        # Only stderr is reported; fail fast instead of waiting on a hidden credential prompt
+        env = _with_git_config({**os.environ, 'GIT_TERMINAL_PROMPT': '0'}, _CLONE_GIT_CONFIG)
+        returncode, stderr = _run_clone(cmd, env, progress_callback)
         
-        if result.returncode == 0:
+        if returncode == 0:
             return True, f"Successfully cloned to: {target_path}"
         else:
-            return False, f"Clone failed: {result.stderr}"
+            return False, f"Clone failed: {stderr}"
     
     except Exception as e:
         return False, f"Error cloning repository: {str(e)}"
 
 
+def _read_git_metadata(repo_path: str, name: str, parse: Callable[[str], str]) -> Optional[str]:
+    """Parse a file under .git, caching the result by path and modification time."""
+    file_path = os.path.join(repo_path, '.git', name)
+    try:
+        key = (file_path, os.stat(file_path).st_mtime_ns)
+        if key not in _GIT_METADATA_CACHE:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                _GIT_METADATA_CACHE[key] = parse(f.read())
+        return _GIT_METADATA_CACHE[key]
+    except (OSError, UnicodeDecodeError):
+        return None
+
+def _parse_head_branch(head: str) -> str:
+    """Get the branch name from .git/HEAD, or an empty string if HEAD is detached."""
+    head = head.strip()
+    return head[len('ref: refs/heads/'):] if head.startswith('ref: refs/heads/') else ""
+
+def _parse_origin_url(config: str) -> str:
+    """Get the origin URL from .git/config."""
+    section = ""
+    for line in config.splitlines():
+        line = line.strip()
+        if line.startswith('['):
+            section = line.strip('[]').strip()
+        elif section == 'remote "origin"' and line.startswith('url'):
+            key, _, value = line.partition('=')
+            if key.strip() == 'url':
+                return value.strip()
+    return ""
+
 def get_current_branch(repo_path: str) -> str:
     """Get current branch name."""
     if not is_git_repository(repo_path):
         return ""
     
+    # Read .git/HEAD directly; fall back to git if it cannot be read
+    branch = _read_git_metadata(repo_path, 'HEAD', _parse_head_branch)
+    if branch is not None:
+        return branch
+    
     try:
         result = subprocess.run(['git', 'branch', '--show-current'], 
                               cwd=repo_path, capture_output=True, text=True)
@@ -64,6 +170,11 @@ def get_remote_url(repo_path: str) -> str:
     if not is_git_repository(repo_path):
         return ""
     
+    # Read .git/config directly; fall back to git if it cannot be read
+    url = _read_git_metadata(repo_path, 'config', _parse_origin_url)
+    if url:
+        return url
+    
     try:
         result = subprocess.run(['git', 'remote', 'get-url', 'origin'], 
                               cwd=repo_path, capture_output=True, text=True)
@@ -74,17 +185,8 @@ def get_remote_url(repo_path: str) -> str:
 
 def get_repository_name_from_url(git_url: str) -> str:
     """Extract repository name from Git URL."""
-    # Remove .git suffix if present
-    if git_url.endswith('.git'):
-        git_url = git_url[:-4]
-    
-    # Extract name from URL
-    if '/' in git_url:
-        repo_name = git_url.split('/')[-1]
-    else:
-        repo_name = git_url
-    
-    return repo_name
+    # Remove .git suffix if present, then take the last path segment
+    return git_url.removesuffix('.git').rpartition('/')[2]
 
 def validate_git_url(git_url: str) -> bool:
     """Validate if string is a valid Git URL."""
@@ -92,60 +194,37 @@ def validate_git_url(git_url: str) -> bool:
         return False
     
     # Common Git URL patterns
-    patterns = [
-        git_url.startswith('https://'),
-        git_url.startswith('http://'),
-        git_url.startswith('git@'),
-        git_url.startswith('ssh://'),
-        git_url.startswith('git://'),
-        '.git' in git_url
-    ]
+    return git_url.startswith(_GIT_URL_SCHEMES) or '.git' in git_url
+
+def iter_git_urls(text: str) -> Iterator[str]:
+    """Yield normalized Git repository URLs found in text, in order, with repeats."""
+    # Every supported URL form contains a colon; skip the regex scan otherwise
+    if not text or ':' not in text:
+        return
     
-    return any(patterns)
+    for match in _GIT_URL_RE.findall(text):
+        # Normalize URL
+        normalized_url = normalize_git_url(match)
+        if normalized_url and validate_git_url(normalized_url):
+            yield normalized_url
 
 def extract_git_urls(text: str) -> List[str]:
     """Extract Git repository URLs from text."""
-    import re
-    
-    git_urls = []
-    
-    # Enhanced Git URL patterns to support various hosting services
-    patterns = [
-        # HTTPS URLs - Generic pattern for any domain
-        r'https?://[a-zA-Z0-9.-]+/[a-zA-Z0-9_.-]+/[a-zA-Z0-9_.-]+(?:\.git)?(?:/.*)?',
-        # SSH URLs - Generic pattern for any domain
-        r'git@[a-zA-Z0-9.-]+:[a-zA-Z0-9_.-]+/[a-zA-Z0-9_.-]+(?:\.git)?',
-        # SSH URLs with custom ports
-        r'ssh://git@[a-zA-Z0-9.-]+(?::[0-9]+)?/[a-zA-Z0-9_.-]+/[a-zA-Z0-9_.-]+(?:\.git)?',
-        # Git protocol URLs
-        r'git://[a-zA-Z0-9.-]+/[a-zA-Z0-9_.-]+/[a-zA-Z0-9_.-]+(?:\.git)?',
-    ]
-    
-    for pattern in patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        for match in matches:
-            # Normalize URL
-            normalized_url = normalize_git_url(match)
-            if normalized_url and validate_git_url(normalized_url) and normalized_url not in git_urls:
-                git_urls.append(normalized_url)
-    
-    return git_urls
+    # Remove duplicates while preserving order
+    return list(dict.fromkeys(iter_git_urls(text)))
 
 def normalize_git_url(url: str) -> Optional[str]:
     """Normalize Git URL."""
-    import re
-    
     if not url:
         return None
     
     # Remove trailing slashes and fragments
-    url = url.rstrip('/').split('#')[0].split('?')[0]
+    url = url.rstrip('/').partition('#')[0].partition('?')[0]
     
     # Convert SSH URL to HTTPS
     if url.startswith('git@'):
         # git@domain:user/repo.git -> https://domain/user/repo
-        ssh_pattern = r'git@([^:]+):(.+)'
-        match = re.match(ssh_pattern, url)
+        match = _SSH_NORMALIZE_RE.match(url)
         if match:
             domain, path = match.groups()
             # Remove .git suffix if present
@@ -154,35 +233,47 @@ def normalize_git_url(url: str) -> Optional[str]:
             url = f"https://{domain}/{path}"
     
     # Ensure .git suffix for consistency
-    if not url.endswith('.git') and not url.endswith('/'):
+    if not url.endswith(('.git', '/')):
         url += '.git'
     
     return url
 
 def get_domain_from_git_url(url: str) -> str:
     """Extract domain from Git URL for display."""
-    from urllib.parse import urlparse
+    # URL schemes are case-insensitive
+    if url[:8].lower().startswith(('https://', 'http://', 'ssh://', 'git://')):
+        start = url.find('://') + 3
+        end = url.find('/', start)
+        netloc = url[start:end] if end >= 0 else url[start:]
+        # Drop user info and port
+        return netloc.rpartition('@')[2].partition(':')[0]
     
-    try:
-        parsed = urlparse(url)
-        return parsed.netloc
-    except Exception:
-        return "unknown"
+    if url.startswith('git@'):
+        colon = url.find(':')
+        return url[4:colon] if colon > 4 else "unknown"
+    
+    return "unknown"
 
 
 def get_unique_directory_name(base_path: str, name: str) -> str:
     """Get unique directory name by appending counter if needed."""
-    import os
-    target_path = os.path.join(base_path, name)
+    # Read the directory once instead of stat-ing each candidate; names are
+    # compared case-insensitively as on default macOS filesystems
+    try:
+        with os.scandir(base_path) as entries:
+            existing = {entry.name.lower() for entry in entries}
+    except OSError:
+        existing = set()
     
-    if not os.path.exists(target_path):
-        return target_path
+    if name.lower() not in existing:
+        return os.path.join(base_path, name)
     
+    prefix = name.lower() + "_"
     counter = 1
-    while os.path.exists(f"{target_path}_{counter}"):
+    while prefix + str(counter) in existing:
         counter += 1
     
-    return f"{target_path}_{counter}"
+    return os.path.join(base_path, f"{name}_{counter}")
 
 def validate_local_repo_name(name: str) -> Tuple[bool, str]:
     """Check if repository name is valid for local filesystem."""
@@ -192,12 +283,11 @@ def validate_local_repo_name(name: str) -> Tuple[bool, str]:
     name = name.strip()
     
     # Check for invalid characters (macOS filesystem)
-    invalid_chars = ['/', ':']
-    if any(char in name for char in invalid_chars):
-        return False, f"Repository name contains invalid characters: {', '.join(invalid_chars)}"
+    if not _INVALID_LOCAL_NAME_CHARS.isdisjoint(name):
+        return False, f"Repository name contains invalid characters: {', '.join(sorted(_INVALID_LOCAL_NAME_CHARS))}"
     
     # Check if name starts or ends with dot or space
-    if name.startswith('.') or name.endswith('.') or name.startswith(' ') or name.endswith(' '):
+    if name[0] in '. ' or name[-1] in '. ':
         return False, "Repository name cannot start or end with dot or space"
     
     # Check length
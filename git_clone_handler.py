@@ -1,13 +1,55 @@
 #!/usr/bin/env python3
 import os
+import re
 import sys
-from pathlib import Path
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from config import get_workspace_dir
-from utils import show_notification, open_with_ide, open_in_finder
-from alfred import print_error
+from utils import show_notification_async, open_with_ide, open_in_finder
 from git import get_repository_name_from_url, get_unique_directory_name
 from github import clone_repository_with_method
 
+# Seconds between checks for the clone reaching checkout
+CHECKOUT_POLL_INTERVAL = 0.05
+
+# Clone progress is notified at most once per this many percent received...
+CLONE_PROGRESS_STEP = 10
+# ...and at most once per this many seconds, so quick clones do not flood Notification Center
+CLONE_PROGRESS_INTERVAL = 3
+
+_RECEIVING_OBJECTS_RE = re.compile(r'Receiving objects:\s+(\d+)%')
+
+def clone_progress_notifier(repo_name):
+    """Build a clone progress callback that shows throttled notifications of objects received."""
+    last_step = 0
+    last_time = time.monotonic()
+    
+    def on_progress(line):
+        nonlocal last_step, last_time
+        match = _RECEIVING_OBJECTS_RE.search(line)
+        if not match:
+            return
+        
+        percent = int(match.group(1))
+        step = percent // CLONE_PROGRESS_STEP
+        now = time.monotonic()
+        # The completion notification covers 100%
+        if step > last_step and percent < 100 and now - last_time >= CLONE_PROGRESS_INTERVAL:
+            last_step, last_time = step, now
+            show_notification_async("Git Clone", f"Cloning {repo_name}: {percent}% received")
+    
+    return on_progress
+
+def wait_for_checkout(clone_future, target_path):
+    """Wait until the clone finishes or begins checkout; return True if checkout began first."""
+    git_dir = os.path.join(target_path, '.git')
+    while not clone_future.done():
+        # git holds index.lock while checking out and writes index when done
+        if os.path.exists(os.path.join(git_dir, 'index.lock')) or os.path.exists(os.path.join(git_dir, 'index')):
+            return True
+        wait([clone_future], timeout=CHECKOUT_POLL_INTERVAL)
+    return False
+
 def main():
     """Main execution function."""
     if len(sys.argv) < 2:
@@ -31,12 +73,11 @@ def main():
     
     # Get workspace directory
     workspace_dir = get_workspace_dir()
-    if not os.path.exists(workspace_dir):
-        try:
-            os.makedirs(workspace_dir, exist_ok=True)
-        except OSError as e:
-            print(f"Failed to create workspace directory: {e}", file=sys.stderr)
-            sys.exit(1)
+    try:
+        os.makedirs(workspace_dir, exist_ok=True)
+    except OSError as e:
+        print(f"Failed to create workspace directory: {e}", file=sys.stderr)
+        sys.exit(1)
     
     # Extract repository name and get unique path
     repo_name = get_repository_name_from_url(git_url)
@@ -44,25 +85,38 @@ def main():
     final_repo_name = os.path.basename(target_path)
     
     # Show clone start notification
-    show_notification("Git Clone", f"Starting to clone {final_repo_name}...")
+    show_notification_async("Git Clone", f"Starting to clone {final_repo_name}...")
     
-    # Execute Git clone using GitHub-aware method
-    success, message = clone_repository_with_method(git_url, target_path, is_private_meta)
+    # Execute Git clone using GitHub-aware method, opening the IDE as soon as
+    # git starts writing the working tree so it can start up in parallel
+    ide_opened = None
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        clone_future = executor.submit(clone_repository_with_method, git_url, target_path, is_private_meta,
+                                       clone_progress_notifier(final_repo_name))
+        if wait_for_checkout(clone_future, target_path):
+            ide_opened = open_with_ide(ide_path, target_path)
+        success, message = clone_future.result()
     
     if success:
         # Show success notification
-        show_notification("Git Clone Complete", f"{final_repo_name} has been successfully cloned")
+        show_notification_async("Git Clone Complete", f"{final_repo_name} has been successfully cloned")
+        
+        # Open with IDE, unless it was already opened during checkout
+        if ide_opened is None:
+            ide_opened = open_with_ide(ide_path, target_path)
         
-        # Open with IDE
-        if open_with_ide(ide_path, target_path):
+        if ide_opened:
             print(f"Success: {target_path} opened in {ide_path}")
         else:
             print(f"Clone successful but failed to open IDE: {target_path}")
             # Open folder in Finder as fallback
             open_in_finder(target_path)
     else:
-        # Show failure notification
-        show_notification("Git Clone Failed", message)
+        # Show failure notification; git removes the target directory, so an IDE
+        # opened during checkout is left on a path that no longer exists
+        if ide_opened:
+            message = f"{message} ({final_repo_name} was already opened in the IDE and can be closed)"
+        show_notification_async("Git Clone Failed", message)
         print(f"Failed: {message}", file=sys.stderr)
         sys.exit(1)
 
@@ -1,11 +1,8 @@
 #!/usr/bin/env python3
 import os
 import sys
-import subprocess
-from pathlib import Path
 from config import get_workspace_dir
-from utils import show_notification, open_with_ide, open_in_finder
-from alfred import print_error
+from utils import show_notification_async, open_with_ide, open_in_finder
 from git import init_repository, validate_local_repo_name
 
 def create_and_init_repository(repo_name, workspace_dir):
@@ -14,13 +11,12 @@ def create_and_init_repository(repo_name, workspace_dir):
         # Create target directory path
         target_path = os.path.join(workspace_dir, repo_name)
         
-        # Check if directory already exists
-        if os.path.exists(target_path):
+        # Create the directory, failing if it already exists
+        try:
+            os.mkdir(target_path)
+        except FileExistsError:
             return False, f"Directory '{repo_name}' already exists in workspace"
         
-        # Create the directory
-        os.makedirs(target_path, exist_ok=True)
-        
         # Initialize Git repository
         success, message = init_repository(target_path)
         
@@ -62,15 +58,14 @@ def main():
     
     # Get workspace directory
     workspace_dir = get_workspace_dir()
-    if not os.path.exists(workspace_dir):
-        try:
-            os.makedirs(workspace_dir, exist_ok=True)
-        except OSError as e:
-            print(f"Failed to create workspace directory: {e}", file=sys.stderr)
-            sys.exit(1)
+    try:
+        os.makedirs(workspace_dir, exist_ok=True)
+    except OSError as e:
+        print(f"Failed to create workspace directory: {e}", file=sys.stderr)
+        sys.exit(1)
     
     # Show initialization start notification
-    show_notification("Git Init", f"Creating new repository '{repo_name}'...")
+    show_notification_async("Git Init", f"Creating new repository '{repo_name}'...")
     
     # Create and initialize Git repository
     success, result = create_and_init_repository(repo_name, workspace_dir)
@@ -78,7 +73,7 @@ def main():
     if success:
         project_path = result
         # Show success notification
-        show_notification("Git Init Complete", f"Repository '{repo_name}' has been created and initialized")
+        show_notification_async("Git Init Complete", f"Repository '{repo_name}' has been created and initialized")
         
         # Open with IDE
         if open_with_ide(ide_path, project_path):
@@ -90,7 +85,7 @@ def main():
     else:
         error_message = result
         # Show failure notification
-        show_notification("Git Init Failed", error_message)
+        show_notification_async("Git Init Failed", error_message)
         print(f"Failed: {error_message}", file=sys.stderr)
         sys.exit(1)
 
@@ -1,9 +1,18 @@
 #!/usr/bin/env python3
 import os
 import sys
-import re
 from alfred import output, error_item, item, handle_empty_query, get_query_from_argv
 from git import validate_local_repo_name
+from config import get_workspace_dir
+
+
+def path_exists(path):
+    """Check if anything, including a dangling symlink, occupies path with a single lstat."""
+    try:
+        os.lstat(path)
+        return True
+    except OSError:
+        return False
 
 
 def main():
@@ -26,11 +35,10 @@ def main():
         sys.exit(0)
     
     # Check if directory already exists in workspace
-    from config import get_workspace_dir
     workspace_dir = get_workspace_dir()
     target_path = os.path.join(workspace_dir, repo_name)
     
-    if os.path.exists(target_path):
+    if path_exists(target_path):
         # Show error for existing directory
         alfred_error_item = error_item(f"Directory '{repo_name}' already exists", f"Choose a different name or remove existing directory: {target_path}")
         output([alfred_error_item])
@@ -1,26 +1,88 @@
 #!/usr/bin/env python3
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from config import get_workspace_dir, get_max_depth
-from alfred import output, error_item, item, handle_error
+from alfred import encode_json, output, stream_raw_output, item, handle_error, get_query_from_argv
 
-def find_git_repos(workspace_dir, max_depth):
-    """Finds git repositories within a given directory."""
+# Threads used to scan top-level workspace directories in parallel
+SCAN_WORKERS = 8
+
+# Every repository item has the same shape; only the name and path vary
+_REPO_ITEM_TEMPLATE = (b'{"title":%(name)b,"subtitle":%(path)b,"arg":%(path)b,"valid":true,'
+                       b'"icon":{"type":"fileicon","path":%(path)b},"uid":%(path)b}')
+
+def _read_dir(path):
+    """Return whether path holds a .git directory, and its subdirectories to descend into."""
+    is_repo = False
+    subdirs = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.name == ".git":
+                if entry.is_dir():
+                    is_repo = True
+                continue  # Don't search inside the .git folder
+            # DirEntry caches the file type, so this needs no extra stat
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+    return is_repo, subdirs
+
+def _list_dir(path):
+    """Like _read_dir, but treat unreadable directories as empty."""
+    try:
+        return _read_dir(path)
+    except OSError:
+        return False, []
+
+def _matches(repo_path, query):
+    """Check if a repository's directory name contains the casefolded query."""
+    return not query or query in os.path.basename(repo_path).casefold()
+
+def _scan_subtree(path, depth, max_depth, query=""):
+    """Finds git repositories under path, starting at the given depth."""
     repo_paths = []
-    start_level = workspace_dir.count(os.sep)
-
-    for root, dirs, _ in os.walk(workspace_dir):
-        current_level = root.count(os.sep)
-        if current_level - start_level >= max_depth:
-            del dirs[:]  # Stop searching deeper in this path
-            continue
-
-        if ".git" in dirs:
-            repo_paths.append(root)
-            dirs.remove(".git") # Don't search inside the .git folder
-    
+
+    def scan(path, depth):
+        if depth >= max_depth:
+            return  # Stop searching deeper in this path
+
+        is_repo, subdirs = _list_dir(path)
+        if is_repo and _matches(path, query):
+            repo_paths.append(path)
+
+        for subdir in subdirs:
+            scan(subdir, depth + 1)
+
+    scan(path, depth)
+    return repo_paths
+
+def find_git_repos(workspace_dir, max_depth, query=""):
+    """Finds git repositories within a given directory, keeping those whose name contains query.
+
+    Raises OSError if workspace_dir itself cannot be read.
+    """
+    # Reading the root also validates it, so no separate isdir check is needed
+    is_repo, subdirs = _read_dir(workspace_dir)
+    if max_depth <= 0:
+        return []
+
+    # Descent is never pruned by query, since a matching repository may sit under a non-matching parent
+    query = query.casefold()
+    repo_paths = [workspace_dir] if is_repo and _matches(workspace_dir, query) else []
+
+    # scandir releases the GIL, so top-level directories can be walked concurrently
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+        futures = [executor.submit(_scan_subtree, subdir, 1, max_depth, query) for subdir in subdirs]
+        for future in futures:
+            repo_paths.extend(future.result())
+
     return repo_paths
 
+def _repo_items(entries):
+    """Yield an Alfred item, as JSON bytes, for each (repo name, repo path) pair."""
+    for repo_name, repo_path in entries:
+        # Only the two strings need JSON escaping; the rest is fixed text
+        yield _REPO_ITEM_TEMPLATE % {b'name': encode_json(repo_name), b'path': encode_json(repo_path)}
 
 
 def main():
@@ -29,24 +91,24 @@ def main():
     workspace_dir = get_workspace_dir()
     max_depth = get_max_depth()
 
-    if not workspace_dir or not os.path.isdir(workspace_dir):
+    # Alfred filters results itself, but an optional query skips building items for non-matches
+    query = get_query_from_argv().strip()
+    try:
+        repo_list = find_git_repos(workspace_dir, max_depth, query)
+    except OSError:
         handle_error("Error: WORKSPACE_DIR is not set or invalid", f"Please set the WORKSPACE_DIR environment variable. Current value: '{workspace_dir}'")
 
-    repo_list = find_git_repos(workspace_dir, max_depth)
-
     if not repo_list:
         not_found_item_result = item("No Git repositories found", f"Searched in: {workspace_dir}", valid=False)
         output([not_found_item_result])
         sys.exit(0)
 
-    alfred_items = []
-    for repo_path in sorted(repo_list): # Sort alphabetically
-        repo_name = os.path.basename(repo_path)
-        alfred_item = item(repo_name, repo_path, repo_path, icon_type="fileicon", uid=repo_path)
-        alfred_item["icon"]["path"] = repo_path
-        alfred_items.append(alfred_item)
+    # Sort alphabetically by the displayed name, computing each basename once
+    entries = [(os.path.basename(repo_path), repo_path) for repo_path in repo_list]
+    entries.sort(key=lambda entry: (entry[0].lower(), entry[1]))
 
-    output(alfred_items)
+    # Items are written one at a time rather than collected into a list first
+    stream_raw_output(_repo_items(entries))
 
 
 if __name__ == "__main__":
@@ -3,29 +3,306 @@
 GitHub API and CLI utilities for Alfred Git Open workflow.
 """
 import json
+import os
 import subprocess
-import re
-import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import shutil
+import string
+import threading
+import time
+from functools import lru_cache
+from itertools import chain
+from pathlib import Path
 from typing import Tuple, List, Dict, Optional, Callable, Any
-from utils import run_command_with_success
+from urllib.parse import quote, urlencode, urlsplit
+from alfred import output, error_item, item, handle_empty_query, get_query_from_argv, get_alfred_workflow_cache_path
+from config import CLONE_METHOD_PRIVATE, CLONE_METHOD_PUBLIC, get_clone_git_args
+
+try:
+    # orjson parses the large search responses several times faster when it is installed
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
+# Seconds a successful GitHub CLI check is trusted across workflow runs
+GH_CLI_CHECK_TTL = 300
+
+# Seconds repository search results are reused across workflow runs
+GH_RESULTS_CACHE_TTL = 60
+
+# Seconds a repository existence check is reused across workflow runs
+GH_REPO_STATUS_CACHE_TTL = 30
+
+# Seconds the authenticated user's login is reused across workflow runs
+GH_USERNAME_CACHE_TTL = 24 * 60 * 60
+
+# Current user's login and whether they own the named repository
+_VIEWER_REPO_QUERY = 'query($name: String!) { viewer { login repository(name: $name) { id } } }'
+
+# Repository fields shown in search results (REST search returns full objects)
+_SEARCH_REPOS_FIELDS = 'nodes { ... on Repository { name owner { login } description url isPrivate stargazerCount } }'
+
+# Login of the authenticated user, once fetched by a GraphQL call
+_gh_cached_viewer: Optional[str] = None
+
+# GitHub repository name rules
+_REPO_NAME_ALNUM = frozenset(string.ascii_letters + string.digits)
+# Deletes every allowed character, so a valid name translates to ''
+_REPO_NAME_ALLOWED_CHARS = str.maketrans('', '', string.ascii_letters + string.digits + '._-')
+
+# Read-only lookups call the API directly with the GitHub CLI's token instead of running gh
+GITHUB_API_URL = 'https://api.github.com'
+GITHUB_API_TIMEOUT = 10
+_gh_token_lock = threading.Lock()
+_api_local = threading.local()
+
+# Prefix of HTTPS GitHub URLs converted by convert_to_ssh_url
+_GITHUB_HTTPS_PREFIX = 'https://github.com/'
+
+# Prefixes of GitHub URLs, each followed by owner/repo
+_GITHUB_URL_PREFIXES = ('https://github.com/', 'http://github.com/', 'git@github.com:', 'ssh://git@github.com/')
+
+@lru_cache(maxsize=1)
+def _gh_executable() -> Optional[str]:
+    """Get the full path of the GitHub CLI, or None if it is not installed."""
+    return shutil.which('gh')
+
+def _run_gh(cmd: List[str], capture_stdout: bool = True) -> subprocess.CompletedProcess:
+    """Run a GitHub CLI command.
+    
+    stdout is kept as raw bytes (json.loads accepts them directly); stderr is
+    decoded only when the command fails.
+    """
+    # subprocess only uses posix_spawn instead of fork+exec for a full executable
+    # path and close_fds=False; the pipes are created non-inheritable anyway
+    args = [_gh_executable() or cmd[0], *cmd[1:]]
+    with subprocess.Popen(args, stdout=subprocess.PIPE if capture_stdout else subprocess.DEVNULL,
+                          stderr=subprocess.PIPE, close_fds=False) as proc:
+        stdout, stderr = proc.communicate()
+    
+    stderr = stderr.decode('utf-8', errors='replace') if proc.returncode != 0 else ''
+    return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
+
+def _gh_token() -> str:
+    """Get the GitHub CLI's auth token, or an empty string if it is unavailable."""
+    # Searches run on several threads; only the first should run gh
+    with _gh_token_lock:
+        return _read_gh_token()
+
+@lru_cache(maxsize=1)
+def _read_gh_token() -> str:
+    """Get the token gh would use, preferring the environment variables it honors."""
+    token = os.environ.get('GH_TOKEN') or os.environ.get('GITHUB_TOKEN')
+    if token:
+        return token
+    
+    try:
+        result = _run_gh(['gh', 'auth', 'token'])
+    except OSError:
+        return ''
+    return result.stdout.decode('utf-8').strip() if result.returncode == 0 else ''
+
+def _api_connection():
+    """Get this thread's keep-alive connection to the GitHub API, opening it on first use."""
+    connection = getattr(_api_local, 'connection', None)
+    if connection is None:
+        # Imported lazily; only the GitHub lookups need an HTTP client
+        from http.client import HTTPConnection, HTTPSConnection
+        
+        api_url = urlsplit(GITHUB_API_URL)
+        connection_class = HTTPSConnection if api_url.scheme == 'https' else HTTPConnection
+        connection = connection_class(api_url.netloc, timeout=GITHUB_API_TIMEOUT)
+        _api_local.connection = connection
+    return connection
+
+def _github_api(path: str, params: Dict[str, Any] = None, body: Dict[str, Any] = None) -> bytes:
+    """Call the GitHub API and return the raw response body.
+    
+    Raises OSError if the request fails or the API returns an error status.
+    """
+    token = _gh_token()
+    if not token:
+        raise OSError("GitHub CLI is not authenticated. Please run: gh auth login")
+    
+    url = urlsplit(GITHUB_API_URL).path + path
+    if params:
+        url += '?' + urlencode(params)
+    headers = {
+        'Authorization': f'Bearer {token}',
+        'Accept': 'application/vnd.github+json',
+        'User-Agent': 'alfred-gitopen',
+    }
+    
+    # Requests made on the same thread reuse one connection, skipping repeated TLS handshakes
+    connection = _api_connection()
+    try:
+        if body is None:
+            connection.request('GET', url, headers=headers)
+        else:
+            headers['Content-Type'] = 'application/json'
+            connection.request('POST', url, body=json.dumps(body).encode('utf-8'), headers=headers)
+        response = connection.getresponse()
+        data = response.read()
+    except Exception as e:
+        # Drop the connection so the next request starts a fresh one
+        connection.close()
+        raise OSError(f"GitHub API request failed: {e}") from e
+    
+    if response.status >= 400:
+        raise OSError(f"HTTP Error {response.status}: {response.reason}")
+    return data
+
+def _gh_clone_git_args() -> List[str]:
+    """Get the trailing gh repo clone arguments passing the clone settings on to git."""
+    git_args = get_clone_git_args()
+    return ['--', *git_args] if git_args else []
+
+def _gh_results_cache_dir() -> Path:
+    """Directory holding cached responses of GitHub API lookups."""
+    return get_alfred_workflow_cache_path() / "gh-results"
+
+def _gh_results_cache_file(path: str, params: Dict[str, Any] = None, body: Dict[str, Any] = None) -> Path:
+    """Path of the file caching the response to an API request."""
+    # Imported lazily; only the result cache needs it
+    import hashlib
+    
+    key = hashlib.sha1(json.dumps([path, params, body], sort_keys=True).encode()).hexdigest()
+    return _gh_results_cache_dir() / f"{key}.json"
+
+def _prune_gh_results_cache(cache_dir: Path, max_age: int) -> None:
+    """Delete cached responses older than max_age seconds."""
+    cutoff = time.time() - max_age
+    try:
+        with os.scandir(cache_dir) as entries:
+            for entry in entries:
+                try:
+                    if entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                except OSError:
+                    pass  # Already removed by a concurrent run
+    except OSError:
+        pass
+
+def _github_api_cached(path: str, params: Dict[str, Any] = None, body: Dict[str, Any] = None,
+                       ttl: int = GH_RESULTS_CACHE_TTL) -> bytes:
+    """Call the GitHub API, reusing a response from the last ttl seconds."""
+    cache_file = _gh_results_cache_file(path, params, body)
+    try:
+        if time.time() - cache_file.stat().st_mtime < ttl:
+            return cache_file.read_bytes()
+    except OSError:
+        pass
+    
+    data = _github_api(path, params, body)
+    try:
+        # Write then rename, so a concurrent run never reads a partial file
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # Every query adds a file, so drop the expired ones before adding another
+        _prune_gh_results_cache(cache_file.parent, max(ttl, GH_RESULTS_CACHE_TTL))
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}")
+        tmp_file.write_bytes(data)
+        tmp_file.replace(cache_file)
+    except OSError:
+        pass  # Caching is best-effort
+    return data
+
+def _search_repos_batch(searches: List[Tuple[str, int]]) -> List[List[Dict]]:
+    """Run several (query, limit) repository searches in one GraphQL request.
+    
+    Results use the field names of gh search repos.
+    """
+    params = ', '.join(f'$q{i}: String!, $n{i}: Int!' for i in range(len(searches)))
+    fields = ' '.join(f's{i}: search(query: $q{i}, type: REPOSITORY, first: $n{i}) {{ {_SEARCH_REPOS_FIELDS} }}'
+                      for i in range(len(searches)))
+    variables = {}
+    for i, (query, limit) in enumerate(searches):
+        variables[f'q{i}'] = query
+        variables[f'n{i}'] = limit
+    
+    body = {'query': f'query({params}) {{ {fields} }}', 'variables': variables}
+    response = _loads(_github_api_cached('/graphql', body=body))
+    data = response.get('data')
+    if response.get('errors'):
+        # GraphQL reports failures in a successful response; do not reuse it
+        _gh_results_cache_file('/graphql', body=body).unlink(missing_ok=True)
+        if not data:
+            raise OSError(response['errors'][0].get('message', 'GitHub search failed'))
+    
+    return [[{
+        'name': repo['name'],
+        'owner': repo['owner'],
+        'description': repo.get('description') or '',
+        'url': repo['url'],
+        'isPrivate': repo['isPrivate'],
+        'stargazersCount': repo['stargazerCount'],
+    } for repo in (data.get(f's{i}') or {}).get('nodes', []) if repo] for i in range(len(searches))]
+
+def _search_repos(query: str, limit: int) -> List[Dict]:
+    """Search repositories, returning them with the field names used by gh search repos."""
+    return _search_repos_batch([(query, limit)])[0]
+
+def _clear_gh_results_cache() -> None:
+    """Drop cached search results after the user's repositories change."""
+    shutil.rmtree(_gh_results_cache_dir(), ignore_errors=True)
+
+def _gh_username_file() -> Path:
+    """Path of the file caching the authenticated user's login."""
+    return get_alfred_workflow_cache_path() / "gh-username"
+
+def _read_cached_username() -> str:
+    """Get the login cached on disk, or an empty string if it is missing or expired."""
+    path = _gh_username_file()
+    try:
+        if time.time() - path.stat().st_mtime < GH_USERNAME_CACHE_TTL:
+            return path.read_text(encoding='utf-8').strip()
+    except OSError:
+        pass
+    return ''
+
+def _write_cached_username(login: str) -> None:
+    """Cache the login on disk for later workflow runs."""
+    path = _gh_username_file()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}")
+        tmp_path.write_text(login, encoding='utf-8')
+        tmp_path.replace(path)
+    except OSError:
+        pass  # Caching is best-effort
+
+def _gh_cli_ok_marker() -> Path:
+    """Path of the file whose mtime records the last successful GitHub CLI check."""
+    return get_alfred_workflow_cache_path() / "gh-cli-ok"
 
 def check_gh_cli() -> Tuple[bool, str]:
     """Check if GitHub CLI is installed and authenticated."""
+    # Skip the gh subprocesses while a recent successful check is on record,
+    # unless ALFRED_GH_FORCE_CHECK asks for a fresh one
+    marker = _gh_cli_ok_marker()
+    try:
+        if not os.environ.get('ALFRED_GH_FORCE_CHECK') and time.time() - marker.stat().st_mtime < GH_CLI_CHECK_TTL:
+            return True, ""
+    except OSError:
+        pass
+    
     try:
         # Check if gh is installed
-        result = subprocess.run(['gh', '--version'], capture_output=True, text=True)
-        if result.returncode != 0:
+        if _gh_executable() is None:
             return False, "GitHub CLI (gh) is not installed. Please install it via: brew install gh"
         
         # Check if user is authenticated
-        result = subprocess.run(['gh', 'auth', 'status'], capture_output=True, text=True)
+        result = _run_gh(['gh', 'auth', 'status'])
         if result.returncode != 0:
             return False, "GitHub CLI is not authenticated. Please run: gh auth login"
-        
-        return True, ""
     except FileNotFoundError:
         return False, "GitHub CLI (gh) is not installed. Please install it via: brew install gh"
+    
+    try:
+        marker.parent.mkdir(parents=True, exist_ok=True)
+        marker.touch()
+    except OSError:
+        pass  # Caching is best-effort
+    
+    return True, ""
 
 def is_valid_repo_name(name: str) -> Tuple[bool, str]:
     """Check if repository name is valid for GitHub."""
@@ -39,14 +316,14 @@ def is_valid_repo_name(name: str) -> Tuple[bool, str]:
         return False, "Repository name cannot be longer than 100 characters"
     
     # Must start and end with alphanumeric characters
-    if not re.match(r'^[a-zA-Z0-9].*[a-zA-Z0-9]$', name) and len(name) > 1:
+    if len(name) > 1 and (name[0] not in _REPO_NAME_ALNUM or name[-1] not in _REPO_NAME_ALNUM):
         return False, "Repository name must start and end with alphanumeric characters"
     
-    if len(name) == 1 and not re.match(r'^[a-zA-Z0-9]$', name):
+    if len(name) == 1 and name not in _REPO_NAME_ALNUM:
         return False, "Single character repository name must be alphanumeric"
     
     # Can contain alphanumeric characters, hyphens, underscores, and periods
-    if not re.match(r'^[a-zA-Z0-9._-]+$', name):
+    if name.translate(_REPO_NAME_ALLOWED_CHARS):
         return False, "Repository name can only contain alphanumeric characters, hyphens, underscores, and periods"
     
     # Cannot contain consecutive periods
@@ -54,121 +331,137 @@ def is_valid_repo_name(name: str) -> Tuple[bool, str]:
         return False, "Repository name cannot contain consecutive periods"
     
     # Cannot be just periods
-    if name.replace('.', '') == '':
+    if not name.strip('.'):
         return False, "Repository name cannot consist only of periods"
     
     return True, ""
 
 def check_repo_exists(repo_name: str) -> bool:
     """Check if repository already exists in user's GitHub account."""
+    # Like gh repo view, a bare name refers to the current user's repository
+    if '/' not in repo_name:
+        username = get_current_username()
+        if not username:
+            return False
+        repo_name = f"{username}/{repo_name}"
+    
     try:
-        result = subprocess.run(['gh', 'repo', 'view', repo_name], capture_output=True, text=True)
-        return result.returncode == 0
+        _github_api(f"/repos/{quote(repo_name)}")
+        return True
     except Exception:
         return False
 
-def search_github_repos(query: str, limit: int = 15, exclude_user_repos: bool = False) -> List[Dict]:
-    """Search GitHub repositories using GitHub CLI."""
+def gh_graphql(query: str, variables: Dict[str, Any] = None, cache_ttl: int = 0) -> Optional[Dict[str, Any]]:
+    """Run a GraphQL query against the GitHub API and return its data, or None on failure.
+    
+    Read-only queries can pass cache_ttl (seconds) to reuse a recent response.
+    """
+    body = {'query': query, 'variables': variables or {}}
     try:
-        # Build search query
-        search_query = query
-        
-        # Add exclusion for user repositories if requested
-        if exclude_user_repos:
-            current_username = get_current_username()
-            if current_username:
-                search_query = f"{query} -user:{current_username}"
-        
-        # Search repositories using gh search repos
-        cmd = [
-            'gh', 'search', 'repos', search_query,
-            '--limit', str(limit),
-            '--json', 'name,owner,description,url,isPrivate,stargazersCount,updatedAt'
-        ]
-        
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        
-        if result.returncode != 0:
-            raise Exception(f"GitHub search failed: {result.stderr}")
-        
-        repos = json.loads(result.stdout)
-        return repos
+        # Partial results (e.g. a missing repository) come with errors alongside the data
+        if cache_ttl:
+            response = _github_api_cached('/graphql', body=body, ttl=cache_ttl)
+        else:
+            response = _github_api('/graphql', body=body)
+        return _loads(response).get('data') or None
+    except (OSError, ValueError, AttributeError):
+        return None
+
+def get_viewer_repo_status(repo_name: str) -> Optional[Tuple[str, bool]]:
+    """Get the current username and whether they own repo_name, in a single API call.
+    
+    Returns None if GitHub CLI is unavailable, unauthenticated or the request failed.
+    """
+    global _gh_cached_viewer
+    
+    # Typing a name re-checks it on every keystroke; answers for missing names are cached too
+    data = gh_graphql(_VIEWER_REPO_QUERY, {'name': repo_name}, cache_ttl=GH_REPO_STATUS_CACHE_TTL)
+    viewer = data.get('viewer') if data else None
+    if not viewer or not viewer.get('login'):
+        return None
+    
+    _gh_cached_viewer = viewer['login']
+    _write_cached_username(_gh_cached_viewer)
+    return _gh_cached_viewer, viewer.get('repository') is not None
+
+def search_github_repos(query: str, limit: int = 15) -> List[Dict]:
+    """Search GitHub repositories using the GitHub API."""
+    try:
+        return _search_repos(query, limit)
         
     except json.JSONDecodeError as e:
         raise Exception(f"Failed to parse GitHub search results: {e}")
     except Exception as e:
         raise Exception(f"GitHub search failed: {str(e)}")
 
+@lru_cache(maxsize=1)
 def get_current_username() -> str:
     """Get the current GitHub username."""
+    # Reuse the login from an earlier GraphQL call in this process
+    if _gh_cached_viewer:
+        return _gh_cached_viewer
+    
+    # Then the login saved by an earlier workflow run
+    username = _read_cached_username()
+    if username:
+        return username
+    
     try:
-        user_result = subprocess.run(['gh', 'api', 'user'], capture_output=True, text=True)
-        if user_result.returncode == 0:
-            user_info = json.loads(user_result.stdout)
-            return user_info.get('login', '')
+        user_info = _loads(_github_api('/user'))
+        username = user_info.get('login', '')
+        if username:
+            _write_cached_username(username)
+        return username
     except Exception:
         pass
     return ''
 
-def get_user_repos(limit: int = 10, query: str = None) -> List[Dict]:
-    """Get user's own repositories using search with owner filter."""
+def search_user_and_other_repos(query: str, user_limit: int = 10,
+                                limit: int = 15) -> Tuple[List[Dict], List[Dict]]:
+    """Search the user's own repositories and everyone else's in a single API call."""
     try:
-        # Use gh search repos with owner filter
-        search_query = query.strip() if query and query.strip() else "*"
-        cmd = [
-            'gh', 'search', 'repos', search_query,
-            '--owner', '@me',
-            '--limit', str(limit),
-            '--json', 'name,owner,description,url,isPrivate,stargazersCount,updatedAt'
-        ]
-        
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        
-        if result.returncode != 0:
-            raise Exception(f"Failed to search user repositories: {result.stderr}")
-        
-        repos = json.loads(result.stdout)
-        
-        # Normalize field names (search uses stargazersCount, list uses stargazerCount)
-        for repo in repos:
-            if 'stargazersCount' in repo and 'stargazerCount' not in repo:
-                repo['stargazerCount'] = repo['stargazersCount']
+        username = get_current_username()
+        if not username:
+            # Without a login only the general search can run
+            return [], _search_repos(query, limit)
         
-        return repos
+        user_repos, other_repos = _search_repos_batch([
+            (f"{query.strip()} user:{username}", user_limit),
+            (f"{query} -user:{username}", limit),
+        ])
+        return user_repos, other_repos
         
     except json.JSONDecodeError as e:
-        raise Exception(f"Failed to parse user repositories: {e}")
+        raise Exception(f"Failed to parse GitHub search results: {e}")
     except Exception as e:
-        raise Exception(f"Failed to get user repositories: {str(e)}")
+        raise Exception(f"GitHub search failed: {str(e)}")
 
 def format_repo_subtitle(repo: Dict) -> str:
     """Format repository subtitle for Alfred display."""
-    parts = []
-    
-    # Privacy status
-    if repo.get('isPrivate'):
-        parts.append("🔒 Private")
-    else:
-        parts.append("🌐 Public")
-    
     # Star count (handle both field names from different gh commands)
     stars = repo.get('stargazerCount', 0) or repo.get('stargazersCount', 0)
-    if stars > 0:
-        if stars >= 1000:
-            star_text = f"⭐ {stars/1000:.1f}k"
-        else:
-            star_text = f"⭐ {stars}"
-        parts.append(star_text)
+    return _format_repo_subtitle(bool(repo.get('isPrivate')), stars, repo.get('description', ''))
+
+@lru_cache(maxsize=512)
+def _format_repo_subtitle(is_private: bool, stars: int, description: str) -> str:
+    """Build a repository subtitle from the fields it shows."""
+    # Privacy status, then star count and description when present
+    privacy = "🔒 Private" if is_private else "🌐 Public"
+    
+    if stars <= 0:
+        star_text = ""
+    elif stars >= 1000:
+        star_text = f" • ⭐ {stars/1000:.1f}k"
+    else:
+        star_text = f" • ⭐ {stars}"
     
-    # Description
-    description = repo.get('description', '').strip()
-    if description:
-        # Limit description length
-        if len(description) > 60:
-            description = description[:57] + "..."
-        parts.append(description)
+    # Description, limited in length
+    description = description.strip()
+    if len(description) > 60:
+        description = description[:57] + "..."
+    description_text = f" • {description}" if description else ""
     
-    return " • ".join(parts)
+    return f"{privacy}{star_text}{description_text}"
 
 def create_github_repository(repo_name: str, private: bool = True, description: str = None) -> Tuple[bool, str]:
     """Create a new GitHub repository."""
@@ -188,9 +481,10 @@ def create_github_repository(repo_name: str, private: bool = True, description:
         
         cmd.append('--add-readme')  # Initialize with README
         
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = _run_gh(cmd)
         
         if result.returncode == 0:
+            _clear_gh_results_cache()
             return True, f"Successfully created GitHub repository: {repo_name}"
         else:
             return False, f"Failed to create repository: {result.stderr}"
@@ -202,9 +496,9 @@ def clone_github_repository(repo_name: str, target_dir: str) -> Tuple[bool, str]
     """Clone a GitHub repository."""
     try:
         # Use GitHub CLI to clone (handles authentication automatically)
-        cmd = ['gh', 'repo', 'clone', repo_name, target_dir]
+        cmd = ['gh', 'repo', 'clone', repo_name, target_dir, *_gh_clone_git_args()]
         
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = _run_gh(cmd, capture_stdout=False)
         
         if result.returncode == 0:
             return True, f"Successfully cloned to: {target_dir}"
@@ -218,9 +512,10 @@ def delete_github_repository(repo_name: str) -> Tuple[bool, str]:
     """Delete a GitHub repository."""
     try:
         cmd = ['gh', 'repo', 'delete', repo_name, '--yes']
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = _run_gh(cmd)
         
         if result.returncode == 0:
+            _clear_gh_results_cache()
             return True, f"Successfully deleted repository: {repo_name}"
         else:
             return False, f"Failed to delete repository: {result.stderr}"
@@ -228,53 +523,52 @@ def delete_github_repository(repo_name: str) -> Tuple[bool, str]:
     except Exception as e:
         return False, f"Error deleting repository: {str(e)}"
 
+def _get_github_owner(git_url: str) -> Optional[str]:
+    """Get the owner from a GitHub repository URL, or None for other URLs."""
+    for prefix in _GITHUB_URL_PREFIXES:
+        if git_url.startswith(prefix):
+            owner, sep, _ = git_url[len(prefix):].partition('/')
+            return owner if sep else None
+    return None
+
+@lru_cache(maxsize=32)
 def is_private_repo(git_url: str, is_private_meta: Optional[bool] = None) -> bool:
     """Check if repository is private."""
     # If metadata is provided, use it
     if is_private_meta is not None:
         return is_private_meta
     
-    # Fallback: check if it's from user's account
-    try:
-        result = subprocess.run(['gh', 'api', 'user'], capture_output=True, text=True)
-        if result.returncode == 0:
-            user_info = json.loads(result.stdout)
-            username = user_info.get('login', '')
-            
-            # Check if URL contains the user's username
-            if username and f'/{username}/' in git_url:
-                return True
-    except Exception:
-        pass
+    # Fallback: check if it's from user's account; other URLs need no username lookup
+    owner = _get_github_owner(git_url)
+    if not owner:
+        return False
     
-    return False
+    username = get_current_username()
+    return bool(username) and owner.lower() == username.lower()
 
 def convert_to_ssh_url(git_url: str) -> str:
     """Convert HTTPS GitHub URL to SSH format."""
-    import re
-    
     # Pattern: https://github.com/owner/repo.git -> git@github.com:owner/repo.git
-    https_pattern = r'https://github\.com/([^/]+)/([^/]+?)(?:\.git)?/?$'
-    match = re.match(https_pattern, git_url)
+    if not git_url.startswith(_GITHUB_HTTPS_PREFIX):
+        return git_url
+    
+    path = git_url[len(_GITHUB_HTTPS_PREFIX):]
+    if path.endswith('/'):
+        path = path[:-1]
     
-    if match:
-        owner, repo = match.groups()
-        return f"git@github.com:{owner}/{repo}.git"
+    owner, _, repo = path.partition('/')
+    if not owner or not repo or '/' in repo:
+        return git_url
     
-    return git_url
+    if repo.endswith('.git') and len(repo) > 4:
+        repo = repo[:-4]
+    return f"git@github.com:{owner}/{repo}.git"
 
 def get_clone_method(git_url: str, is_private_meta: Optional[bool] = None) -> str:
     """Determine the best clone method based on repository type and user settings."""
-    import os
-    
-    is_private = is_private_repo(git_url, is_private_meta)
-    
-    if is_private:
-        method = os.environ.get('CLONE_METHOD_PRIVATE', 'ssh').lower()
-    else:
-        method = os.environ.get('CLONE_METHOD_PUBLIC', 'https').lower()
-    
-    return method
+    if is_private_repo(git_url, is_private_meta):
+        return CLONE_METHOD_PRIVATE
+    return CLONE_METHOD_PUBLIC
 
 def fork_github_repository(repo_name: str, organization: str = None) -> Tuple[bool, str]:
     """Fork a GitHub repository."""
@@ -287,9 +581,10 @@ def fork_github_repository(repo_name: str, organization: str = None) -> Tuple[bo
         # Don't clone automatically, we'll handle that separately
         cmd.append('--remote=false')
         
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = _run_gh(cmd)
         
         if result.returncode == 0:
+            _clear_gh_results_cache()
             return True, f"Successfully forked repository: {repo_name}"
         else:
             return False, f"Failed to fork repository: {result.stderr}"
@@ -300,65 +595,59 @@ def fork_github_repository(repo_name: str, organization: str = None) -> Tuple[bo
 def fork_and_clone_repository(repo_name: str, target_dir: str, organization: str = None) -> Tuple[bool, str]:
     """Fork a GitHub repository and clone it locally."""
     try:
-        # First, fork the repository
-        success, message = fork_github_repository(repo_name, organization)
-        if not success:
-            return False, message
-        
-        # Get the current user's username for the forked repo URL
-        result = subprocess.run(['gh', 'api', 'user'], capture_output=True, text=True)
-        if result.returncode != 0:
-            return False, "Failed to get current user information"
+        # gh forks and clones the fork in a single run; arguments after -- go to git clone,
+        # and gh only takes the first one as the clone directory, so it must come first
+        cmd = ['gh', 'repo', 'fork', repo_name, '--clone']
         
-        user_info = json.loads(result.stdout)
-        username = user_info.get('login', '')
-        
-        if not username:
-            return False, "Failed to get username from GitHub"
+        if organization:
+            cmd.extend(['--org', organization])
         
-        # Construct the forked repository name
-        original_repo = repo_name.split('/')[-1] if '/' in repo_name else repo_name
-        forked_repo_name = f"{username}/{original_repo}"
+        cmd.extend(['--', target_dir, *get_clone_git_args()])
         
-        # Clone the forked repository
-        clone_success, clone_message = clone_github_repository(forked_repo_name, target_dir)
+        result = _run_gh(cmd, capture_stdout=False)
         
-        if clone_success:
+        if result.returncode == 0:
+            _clear_gh_results_cache()
             return True, f"Successfully forked and cloned to: {target_dir}"
         else:
-            return False, f"Forked successfully but clone failed: {clone_message}"
+            return False, f"Failed to fork and clone repository: {result.stderr}"
     
     except Exception as e:
         return False, f"Error in fork and clone process: {str(e)}"
 
-def clone_repository_with_method(git_url: str, target_dir: str, is_private_meta: Optional[bool] = None) -> Tuple[bool, str]:
-    """Clone a Git repository using the appropriate method."""
-    from git import clone_repository
+def clone_repository_with_method(git_url: str, target_dir: str, is_private_meta: Optional[bool] = None,
+                                 progress_callback: Optional[Callable[[str], None]] = None) -> Tuple[bool, str]:
+    """Clone a Git repository using the appropriate method.
     
+    progress_callback receives git's progress lines; the gh method does not report progress.
+    """
     clone_method = get_clone_method(git_url, is_private_meta)
     
     try:
         if clone_method == 'gh':
             # Use GitHub CLI
-            cmd = ['gh', 'repo', 'clone', git_url, target_dir]
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            cmd = ['gh', 'repo', 'clone', git_url, target_dir, *_gh_clone_git_args()]
+            result = _run_gh(cmd, capture_stdout=False)
             
             if result.returncode == 0:
                 return True, f"Successfully cloned to: {target_dir}"
             else:
                 return False, f"Clone failed: {result.stderr}"
         else:
+            # Imported lazily; the search and input workflows never clone
+            from git import clone_repository
+            
             # Use git clone with URL conversion if needed
             clone_url = git_url
             if clone_method == 'ssh' and git_url.startswith('https://github.com/'):
                 clone_url = convert_to_ssh_url(git_url)
             
             # Use git.py clone function with fallback
-            success, message = clone_repository(clone_url, target_dir)
+            success, message = clone_repository(clone_url, target_dir, progress_callback=progress_callback)
             
             if not success and clone_method == 'ssh' and not is_private_repo(git_url, is_private_meta):
                 # Fallback to HTTPS for public repos
-                success, message = clone_repository(git_url, target_dir)
+                success, message = clone_repository(git_url, target_dir, progress_callback=progress_callback)
                 if success:
                     message += " (fallback to HTTPS)"
             
@@ -393,8 +682,6 @@ def github_search_base(
         search_limit: Maximum number of search results
         include_user_repos: Whether to include user's own repositories
     """
-    from alfred import output, error_item, item, handle_empty_query, get_query_from_argv
-    
     # Check if GitHub CLI is available
     is_available, error_msg = check_gh_cli()
     if not is_available:
@@ -411,60 +698,41 @@ def github_search_base(
     
     try:
         items = []
-        current_username = get_current_username()
         
-        # Get repositories using parallel execution
-        all_repos = []
-        seen_urls = set()
-        
-        # Execute searches in parallel
-        with ThreadPoolExecutor(max_workers=2) as executor:
-            futures = []
-            
-            # Submit user repos search if requested
-            if include_user_repos:
-                user_repos_future = executor.submit(get_user_repos, 10, query)
-                futures.append(('user_repos', user_repos_future))
-            
-            # Submit public repos search (exclude user repos if we're including them separately)
-            search_repos_future = executor.submit(search_github_repos, query, search_limit, include_user_repos)
-            futures.append(('search_repos', search_repos_future))
-            
-            # Collect results as they complete
-            user_repos = []
-            search_repos = []
+        if include_user_repos:
+            # One request covers both the user's repositories and everyone else's, so
+            # report a failure rather than show it as no results for both
+            try:
+                user_repos, search_repos = search_user_and_other_repos(query, 10, search_limit)
+            except Exception as e:
+                output([error_item("Search failed", str(e))])
+                return
+        else:
+            # Imported lazily; only this search runs requests in parallel
+            from concurrent.futures import ThreadPoolExecutor
             
-            for future_type, future in futures:
+            # The username is only needed for filtering here, so look it up alongside the search
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                executor.submit(get_current_username)
+                search_repos_future = executor.submit(search_github_repos, query, search_limit)
                 try:
-                    result = future.result(timeout=30)
-                    if future_type == 'user_repos':
-                        user_repos = result
-                    elif future_type == 'search_repos':
-                        search_repos = result
-                except Exception as e:
-                    # Log error but continue with other results
-                    pass  # Silently handle errors from individual searches
-                    if future_type == 'user_repos':
-                        user_repos = []
-                    elif future_type == 'search_repos':
-                        search_repos = []
+                    search_repos = search_repos_future.result(timeout=30)
+                except Exception:
+                    search_repos = []  # Show no results rather than fail
+            user_repos = []
         
-        # Add user repos first (higher priority)
-        for repo in user_repos:
-            url = repo.get('url', '')
-            if url not in seen_urls:
-                all_repos.append(repo)
-                seen_urls.add(url)
+        # Already cached by the lookup above
+        current_username = get_current_username()
         
-        # Add search results
-        for repo in search_repos:
-            url = repo.get('url', '')
-            if url not in seen_urls:
-                all_repos.append(repo)
-                seen_urls.add(url)
+        # Merge by URL, keeping the first occurrence so user repos take priority
+        merged_repos = {}
+        for repo in chain(user_repos, search_repos):
+            merged_repos.setdefault(repo.get('url', ''), repo)
+            if len(merged_repos) == search_limit:
+                break
         
         # Filter and format repositories
-        for repo in all_repos[:search_limit]:
+        for repo in merged_repos.values():
             # Apply filter if provided
             if repo_filter_func and not repo_filter_func(repo, current_username):
                 continue
@@ -515,8 +783,6 @@ def fork_repo_filter(repo: Dict[str, Any], username: str) -> bool:
 
 def clone_item_formatter(repo: Dict[str, Any]) -> Dict[str, Any]:
     """Format Alfred item for clone workflow."""
-    from alfred import item
-    
     owner = repo.get('owner', {})
     repo_name = repo.get('name', '')
     owner_login = owner.get('login', '') if isinstance(owner, dict) else str(owner)
@@ -533,8 +799,6 @@ def clone_item_formatter(repo: Dict[str, Any]) -> Dict[str, Any]:
 
 def fork_item_formatter(repo: Dict[str, Any]) -> Dict[str, Any]:
     """Format Alfred item for fork workflow."""
-    from alfred import item
-    
     owner = repo.get('owner', {})
     repo_name = repo.get('name', '')
     owner_login = owner.get('login', '') if isinstance(owner, dict) else str(owner)
@@ -1,11 +1,10 @@
 #!/usr/bin/env python3
 import os
 import sys
-from pathlib import Path
 from config import get_workspace_dir
 from github import fork_and_clone_repository
 from git import get_unique_directory_name
-from utils import show_notification, open_with_ide, open_in_finder
+from utils import show_notification_async, open_with_ide, open_in_finder
 
 def main():
     """Main execution function."""
@@ -34,27 +33,26 @@ def main():
     
     # Get workspace directory
     workspace_dir = get_workspace_dir()
-    if not os.path.exists(workspace_dir):
-        try:
-            os.makedirs(workspace_dir, exist_ok=True)
-        except OSError as e:
-            print(f"Failed to create workspace directory: {e}", file=sys.stderr)
-            sys.exit(1)
+    try:
+        os.makedirs(workspace_dir, exist_ok=True)
+    except OSError as e:
+        print(f"Failed to create workspace directory: {e}", file=sys.stderr)
+        sys.exit(1)
     
     # Extract repository name for local directory
-    local_repo_name = repo_name.split('/')[-1] if '/' in repo_name else repo_name
+    local_repo_name = repo_name.rpartition('/')[2]
     target_path = get_unique_directory_name(workspace_dir, local_repo_name)
     final_repo_name = os.path.basename(target_path)
     
     # Show fork start notification
-    show_notification("GitHub Fork", f"Forking repository '{repo_name}'...")
+    show_notification_async("GitHub Fork", f"Forking repository '{repo_name}'...")
     
     # Execute GitHub fork and clone
     success, message = fork_and_clone_repository(repo_name, target_path)
     
     if success:
         # Show success notification
-        show_notification("GitHub Fork Complete", f"Repository '{repo_name}' has been forked and cloned successfully")
+        show_notification_async("GitHub Fork Complete", f"Repository '{repo_name}' has been forked and cloned successfully")
         
         # Open with IDE
         if open_with_ide(ide_path, target_path):
@@ -65,7 +63,7 @@ def main():
             open_in_finder(target_path)
     else:
         # Show failure notification
-        show_notification("GitHub Fork Failed", message)
+        show_notification_async("GitHub Fork Failed", message)
         print(f"Failed: {message}", file=sys.stderr)
         sys.exit(1)
 
@@ -1,21 +1,20 @@
 #!/usr/bin/env python3
-import sys
-from github import check_gh_cli, is_valid_repo_name, check_repo_exists
+from github import check_gh_cli, is_valid_repo_name, check_repo_exists, get_viewer_repo_status
 from alfred import output, error_item, item, handle_empty_query, get_query_from_argv
 
 def main():
     """Main execution function."""
-    # Check GitHub CLI
-    is_available, error_msg = check_gh_cli()
-    if not is_available:
-        alfred_error_item = error_item("GitHub CLI Required", error_msg)
-        output([alfred_error_item])
-        return
-    
     # Get query from Alfred (repository name input)
     query = get_query_from_argv()
     
     if not query.strip():
+        # Check GitHub CLI
+        is_available, error_msg = check_gh_cli()
+        if not is_available:
+            alfred_error_item = error_item("GitHub CLI Required", error_msg)
+            output([alfred_error_item])
+            return
+        
         handle_empty_query("Enter GitHub repository name", "Type the name for your new GitHub repository")
         return
     
@@ -30,8 +29,21 @@ def main():
         output([alfred_error_item])
         return
     
+    # Check authentication and repository existence in one GitHub API call
+    status = get_viewer_repo_status(repo_name)
+    if status is None:
+        # Find out why the call failed, or fall back to a plain existence check
+        is_available, error_msg = check_gh_cli()
+        if not is_available:
+            alfred_error_item = error_item("GitHub CLI Required", error_msg)
+            output([alfred_error_item])
+            return
+        repo_exists = check_repo_exists(repo_name)
+    else:
+        _, repo_exists = status
+    
     # Check if repository already exists
-    if check_repo_exists(repo_name):
+    if repo_exists:
         alfred_error_item = error_item(
             f"Repository '{repo_name}' already exists",
             "Choose a different name or use githubclone to clone the existing repository"
@@ -1,22 +1,12 @@
 #!/usr/bin/env python3
 import os
 import sys
-from config import get_ides_to_check, get_app_search_paths
-from alfred import output, error_item, item, handle_error
+from config import get_ides_to_check, find_app_bundle
+from alfred import output, item, handle_error
 
 def find_app_path(app_name):
     """Checks for an app in standard macOS application directories."""
-    app_name = app_name + ".app"
-    
-    # Get search paths from config
-    search_paths = get_app_search_paths()
-    
-    # Return the first path that exists
-    for search_path in search_paths:
-        full_path = search_path / app_name
-        if full_path.exists():
-            return str(full_path)
-    return None
+    return find_app_bundle(app_name + ".app")
 
 
 def main():
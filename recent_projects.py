@@ -1,24 +1,48 @@
 #!/usr/bin/env python3
 import os
+import re
 import sys
 import json
 import sqlite3
+import time
+import unicodedata
 from pathlib import Path
-from datetime import datetime
-import xml.etree.ElementTree as ET
+from contextlib import closing
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import unquote
 
+try:
+    # lxml parses in C; use it for large recent project files when installed
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
+
+try:
+    # orjson parses the recently opened list several times faster when it is installed
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
 from config import (
-    get_app_search_paths, 
+    find_app_bundle,
     get_ides_to_check,
     get_ide_app_name,
     is_jetbrains_ide,
     is_vscode_ide, 
     get_vscode_config_path,
-    JETBRAINS_IDES,
-    VSCODE_IDES
+    is_recent_projects_check
 )
-from alfred import output, item, no_results_item
+from alfred import output, stream_output, item, no_results_item
+
+# Maximum number of IDEs whose recent projects are read concurrently
+RECENT_PROJECT_WORKERS = 8
+
+# The "folder" value of a VSCode workspace.json, read without parsing the whole file
+_WORKSPACE_FOLDER_RE = re.compile(rb'"folder"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+# JetBrains path macros such as $USER_HOME$
+_PATH_MACRO_RE = re.compile(r'\$[^$]+\$')
 
 def get_jetbrains_recent_projects(ide_name, app_path):
     """Get recent projects for JetBrains IDEs."""
@@ -45,15 +69,20 @@ def get_vscode_recent_projects(ide_name, app_path):
     
     return get_vscode_projects(state_db_path, ide_name, app_path)
 
+def get_recent_projects(ide_name, app_path):
+    """Get recent projects for an IDE based on its type."""
+    if is_jetbrains_ide(ide_name):
+        return get_jetbrains_recent_projects(ide_name, app_path)
+    elif is_vscode_ide(ide_name):
+        return get_vscode_recent_projects(ide_name, app_path)
+    return []
+
 # -----------------------------------------------------------------------------
 
 def find_application(app_name):
     """Finds the full path of an application from the search paths."""
-    app_search_paths = get_app_search_paths()
-    for search_path in app_search_paths:
-        if (search_path / app_name).exists():
-            return str(search_path / app_name)
-    return None
+    # Each search path is listed once and shared by every IDE
+    return find_app_bundle(app_name)
 
 def get_jetbrains_projects(config_path, ide_name, app_path):
     """Parses recent projects for JetBrains IDEs."""
@@ -65,56 +94,131 @@ def get_jetbrains_projects(config_path, ide_name, app_path):
         return []
 
     try:
-        tree = ET.parse(xml_file_path)
-        root = tree.getroot()
         path_macros = {'$USER_HOME$': str(Path.home())}
+        entries = []
         
-        for component in root.iter('component'):
-            if component.get('name') == 'PathMacros':
-                for macro in component.iter('macro'):
-                    name, value = macro.get('name'), macro.get('value')
-                    if name and value: path_macros[f'${name}$'] = value
-                break
-
-        recent_projects_manager = root.find(".//component[@name='RecentProjectsManager']")
-        if not recent_projects_manager:
-            return []
-
-        for entry in recent_projects_manager.findall(".//option[@name='additionalInfo']/map/entry"):
-            path = entry.get('key')
+        # Stream the file once, clearing each project entry after reading it
+        parents = []
+        component = None
+        for event, elem in ET.iterparse(str(xml_file_path), events=('start', 'end')):
+            if event == 'start':
+                if elem.tag == 'component':
+                    component = elem.get('name')
+                parents.append(elem)
+                continue
+            parents.pop()
+            
+            if component == 'PathMacros' and elem.tag == 'macro':
+                name, value = elem.get('name'), elem.get('value')
+                if name and value: path_macros[f'${name}$'] = value
+            elif (component == 'RecentProjectsManager' and elem.tag == 'entry' and len(parents) >= 2
+                  and parents[-1].tag == 'map' and parents[-2].tag == 'option'
+                  and parents[-2].get('name') == 'additionalInfo'):
+                project_info = elem.find('.//RecentProjectMetaInfo')
+                if project_info is not None:
+                    timestamp = None
+                    for option in project_info.iter('option'):
+                        if option.get('name') == 'activationTimestamp':
+                            timestamp = option.get('value')
+                            break
+                    entries.append((elem.get('key'), timestamp))
+                elem.clear()
+            elif elem.tag == 'component':
+                component = None
+                elem.clear()
+
+        for path, timestamp in entries:
             if not path: continue
 
-            real_path_str = path
-            for macro, value in path_macros.items():
-                real_path_str = real_path_str.replace(macro, value)
+            # Expand all macros in one scan; unknown macros are left for the check below
+            real_path_str = _PATH_MACRO_RE.sub(lambda m: path_macros.get(m.group(0), m.group(0)), path)
             
             if '$' in real_path_str: continue
             
-            real_path = Path(real_path_str).resolve()
-            
-            project_info = entry.find('.//RecentProjectMetaInfo')
-            if project_info is not None:
-                project_name = real_path.name
-                timestamp = None
-                for option in project_info.iter('option'):
-                    if option.get('name') == 'activationTimestamp':
-                        timestamp = option.get('value')
-                        break
-
-                if project_name and timestamp:
-                    projects.append({
-                        'name': project_name,
-                        'path': str(real_path),
-                        'timestamp': int(timestamp),
-                        'ide_name': ide_name,
-                        'app_path': app_path
-                    })
-    except (ET.ParseError, FileNotFoundError):
+            # Normalize as a string; resolving symlinks would cost syscalls per project
+            real_path_str = os.path.normpath(real_path_str)
+            project_name = os.path.basename(real_path_str)
+
+            if project_name and timestamp:
+                projects.append({
+                    'name': project_name,
+                    'path': real_path_str,
+                    'timestamp': int(timestamp),
+                    'ide_name': ide_name,
+                    'app_path': app_path
+                })
+    except (ET.ParseError, OSError):
         return []
     
     return projects
 
 
+def _name_key(name):
+    """Fold a file name the way default macOS volumes compare names (case and Unicode form)."""
+    return unicodedata.normalize('NFC', name).casefold()
+
+def _existing_paths(paths):
+    """Get the paths that exist, listing each parent directory once instead of stat-ing every path."""
+    names_by_parent = {}
+    for path in paths:
+        parent, name = os.path.split(os.path.normpath(path))
+        names_by_parent.setdefault(parent, {}).setdefault(name, []).append(path)
+    
+    existing = set()
+    for parent, names in names_by_parent.items():
+        unmatched = dict(names)
+        folded_names = set()
+        try:
+            with os.scandir(parent) as entries:
+                for entry in entries:
+                    matched = unmatched.pop(entry.name, None)
+                    # A symlink only counts when its target exists, as with Path.exists()
+                    if matched and (not entry.is_symlink() or os.path.exists(entry.path)):
+                        existing.update(matched)
+                    folded_names.add(_name_key(entry.name))
+        except OSError:
+            continue
+        
+        # Names differing only in case or Unicode form may still resolve, depending on the volume
+        for name, name_paths in unmatched.items():
+            if _name_key(name) in folded_names:
+                existing.update(path for path in name_paths if os.path.exists(path))
+    return existing
+
+def _get_workspace_timestamps(workspace_storage_path, folder_uris):
+    """Map each of folder_uris to the last modified time (ms) of its VSCode workspace storage."""
+    workspace_timestamps = {}
+    if not folder_uris:
+        return workspace_timestamps
+    
+    try:
+        # scandir reports directory entries without a stat per entry;
+        # a missing workspace.json just fails to open
+        with os.scandir(workspace_storage_path) as workspace_dirs:
+            for workspace_dir in workspace_dirs:
+                if not workspace_dir.is_dir():
+                    continue
+                try:
+                    with open(os.path.join(workspace_dir.path, "workspace.json"), 'rb') as f:
+                        match = _WORKSPACE_FOLDER_RE.search(f.read())
+                    if not match:
+                        continue
+                    
+                    # Only escaped strings need the JSON decoder
+                    folder_uri = match.group(1)
+                    folder_uri = _loads(b'"' + folder_uri + b'"') if b'\\' in folder_uri else folder_uri.decode('utf-8')
+                    
+                    # Skip workspaces of projects that are not listed
+                    if folder_uri in folder_uris:
+                        # Get the last modified time of the workspace directory
+                        timestamp = workspace_dir.stat().st_mtime_ns // 1_000_000  # Convert to milliseconds
+                        workspace_timestamps[folder_uri] = timestamp
+                except (ValueError, OSError):
+                    continue
+    except OSError:
+        pass  # No workspace storage
+    return workspace_timestamps
+
 def get_vscode_projects(state_db_path, ide_name, app_path):
     """Parses recent projects for VSCode-like IDEs from state.vscdb."""
     projects = []
@@ -123,64 +227,46 @@ def get_vscode_projects(state_db_path, ide_name, app_path):
         
     try:
         # Connect to the SQLite database (read-only)
-        con = sqlite3.connect(f'file:{state_db_path}?mode=ro', uri=True)
-        cur = con.cursor()
-        
-        # Query for the specific key
-        res = cur.execute("SELECT value FROM ItemTable WHERE key = 'history.recentlyOpenedPathsList'")
-        data = res.fetchone()
-        
-        con.close()
+        with closing(sqlite3.connect(f'file:{state_db_path}?mode=ro', uri=True)) as con:
+            # Query for the specific key
+            data = con.execute("SELECT value FROM ItemTable WHERE key = 'history.recentlyOpenedPathsList'").fetchone()
         
         if data:
-            # The value is a JSON string - check if it's bytes or string
-            json_data = data[0]
-            if isinstance(json_data, bytes):
-                json_data = json_data.decode('utf-8')
+            # The value is a JSON string, stored as bytes or text; both parse directly
+            recent_data = _loads(data[0])
             
-            recent_data = json.loads(json_data)
+            # Collect local paths from the recent entries
+            recent_paths = []
+            for entry in recent_data.get('entries', []):
+                uri = entry.get('folderUri') or entry.get('fileUri')
+                if uri and uri.startswith('file:///'):
+                    path_str = uri[7:]  # Remove 'file://' prefix
+                    # Only percent-encoded URIs need decoding
+                    if '%' in path_str:
+                        path_str = unquote(path_str)
+                    recent_paths.append((uri, path_str))
             
-            # Get workspace storage path for timestamp lookup
-            user_data_path = state_db_path.parent.parent
-            workspace_storage_path = user_data_path / "workspaceStorage"
+            # Check if paths still exist
+            if is_recent_projects_check():
+                existing = _existing_paths([path_str for _, path_str in recent_paths])
+                recent_paths = [(uri, path_str) for uri, path_str in recent_paths if path_str in existing]
             
-            # Create a mapping of folder URIs to workspace storage timestamps
-            workspace_timestamps = {}
-            if workspace_storage_path.exists():
-                for workspace_dir in workspace_storage_path.iterdir():
-                    if workspace_dir.is_dir():
-                        workspace_json = workspace_dir / "workspace.json"
-                        if workspace_json.exists():
-                            try:
-                                with open(workspace_json, 'r') as f:
-                                    workspace_data = json.load(f)
-                                    folder_uri = workspace_data.get('folder')
-                                    if folder_uri:
-                                        # Get the last modified time of the workspace directory
-                                        timestamp = int(workspace_dir.stat().st_mtime * 1000)  # Convert to milliseconds
-                                        workspace_timestamps[folder_uri] = timestamp
-                            except (json.JSONDecodeError, OSError):
-                                continue
+            # Get workspace storage timestamps, only for the URIs that will be listed
+            workspace_storage_path = state_db_path.parent.parent / "workspaceStorage"
+            workspace_timestamps = _get_workspace_timestamps(workspace_storage_path, {uri for uri, _ in recent_paths})
             
-            # Process entries and match with workspace timestamps
-            for index, entry in enumerate(recent_data.get('entries', [])):
-                uri = entry.get('folderUri') or entry.get('fileUri')
-                if uri and uri.startswith('file:///'):
-                    path_str = unquote(uri[7:])  # Remove 'file://' prefix
-                    path = Path(path_str)
-                    
-                    # Check if path still exists
-                    if path.exists():
-                        # Get timestamp from workspace storage if available
-                        timestamp = workspace_timestamps.get(uri, 0)
-                        
-                        projects.append({
-                            'name': path.name,
-                            'path': path_str,
-                            'timestamp': timestamp,  # Use actual workspace timestamp
-                            'ide_name': ide_name,
-                            'app_path': app_path
-                        })
+            # Match entries with workspace timestamps
+            for uri, path_str in recent_paths:
+                # Get timestamp from workspace storage if available
+                timestamp = workspace_timestamps.get(uri, 0)
+                
+                projects.append({
+                    'name': os.path.basename(path_str.rstrip('/')),
+                    'path': path_str,
+                    'timestamp': timestamp,  # Use actual workspace timestamp
+                    'ide_name': ide_name,
+                    'app_path': app_path
+                })
     except (sqlite3.Error, json.JSONDecodeError) as e:
         # Debug: print error for troubleshooting
         print(f"Error reading VSCode projects: {e}", file=sys.stderr)
@@ -189,12 +275,35 @@ def get_vscode_projects(state_db_path, ide_name, app_path):
     return projects
 
 
+def _project_items(projects):
+    """Yield an Alfred item for each recent project."""
+    for proj in projects:
+        # Format timestamp if available
+        timestamp = proj.get('timestamp')
+        if timestamp:
+            last_opened_str = _format_last_used(timestamp // 1000)
+            subtitle = f"Last Used: {last_opened_str} - {proj['path']}"
+        else:
+            subtitle = proj['path']
+
+        alfred_item = item(f"{proj['name']} ({proj['ide_name']})", subtitle, f"{proj['app_path']}|{proj['path']}", icon_type="fileicon")
+        alfred_item["icon"]["path"] = proj['app_path']
+        yield alfred_item
+
+@lru_cache(maxsize=256)
+def _format_last_used(seconds):
+    """Format a Unix time in seconds as local date and time."""
+    # time.localtime avoids building a datetime object per project
+    return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(seconds))
+
+
 def main():
     all_projects = []
     
     # Get IDE list from config
     ides_to_check = get_ides_to_check()
     
+    installed_ides = []
     for ide_id, ide_name in ides_to_check:
         # Get app name for this IDE
         app_name = get_ide_app_name(ide_name)
@@ -206,35 +315,23 @@ def main():
         if not app_path:
             continue
         
-        # Get recent projects based on IDE type
-        if is_jetbrains_ide(ide_name):
-            projects = get_jetbrains_recent_projects(ide_name, app_path)
-            all_projects.extend(projects)
-        elif is_vscode_ide(ide_name):
-            projects = get_vscode_recent_projects(ide_name, app_path)
-            all_projects.extend(projects)
+        installed_ides.append((ide_name, app_path))
+    
+    # Each IDE's history is read independently, so read them concurrently
+    if installed_ides:
+        with ThreadPoolExecutor(max_workers=min(RECENT_PROJECT_WORKERS, len(installed_ides))) as executor:
+            for projects in executor.map(get_recent_projects, *zip(*installed_ides)):
+                all_projects.extend(projects)
     
     # Sort projects by timestamp (most recent first)
     sorted_projects = sorted(all_projects, key=lambda x: x.get('timestamp', 0), reverse=True)
     
-    alfred_items = []
     if not sorted_projects:
-        alfred_items.append(no_results_item("", "recent projects"))
-
-    for proj in sorted_projects:
-        # Format timestamp if available
-        timestamp = proj.get('timestamp')
-        if timestamp:
-            last_opened_str = datetime.fromtimestamp(timestamp / 1000).strftime('%Y-%m-%d %H:%M:%S')
-            subtitle = f"Last Used: {last_opened_str} - {proj['path']}"
-        else:
-            subtitle = proj['path']
-
-        alfred_item = item(f"{proj['name']} ({proj['ide_name']})", subtitle, f"{proj['app_path']}|{proj['path']}", icon_type="fileicon")
-        alfred_item["icon"]["path"] = proj['app_path']
-        alfred_items.append(alfred_item)
-        
-    output(alfred_items)
+        output([no_results_item("", "recent projects")])
+        return
+    
+    # Write items one at a time instead of building the whole list first
+    stream_output(_project_items(sorted_projects))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,20 @@
+import unittest
+
+from config import get_ide_app_name, get_vscode_config_path, VSCODE_IDES
+
+
+class IdeKeyPriorityTest(unittest.TestCase):
+    def test_earlier_key_wins_over_leftmost_match(self):
+        # 'goland' comes before 'pycharm' in the table although it appears later in the name
+        self.assertEqual(get_ide_app_name('PyCharm GoLand'), 'GoLand.app')
+
+    def test_vscode_key_order(self):
+        self.assertEqual(get_vscode_config_path('vscode Visual Studio Code'),
+                         VSCODE_IDES['visual studio code']['config_path'])
+
+    def test_unknown_ide(self):
+        self.assertIsNone(get_ide_app_name('Xcode'))
+
+
+if __name__ == '__main__':
+    unittest.main()
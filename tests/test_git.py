@@ -0,0 +1,24 @@
+import unittest
+
+from git import get_domain_from_git_url
+
+
+class GetDomainFromGitUrlTest(unittest.TestCase):
+    def test_https_url(self):
+        self.assertEqual(get_domain_from_git_url('https://github.com/x/y.git'), 'github.com')
+
+    def test_uppercase_scheme(self):
+        self.assertEqual(get_domain_from_git_url('HTTPS://GitHub.com/x/y.git'), 'GitHub.com')
+
+    def test_ssh_url_with_user_and_port(self):
+        self.assertEqual(get_domain_from_git_url('ssh://git@example.com:2222/x/y.git'), 'example.com')
+
+    def test_scp_style_url(self):
+        self.assertEqual(get_domain_from_git_url('git@github.com:x/y.git'), 'github.com')
+
+    def test_unrecognized_url(self):
+        self.assertEqual(get_domain_from_git_url('not a url'), 'unknown')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import github
+
+
+class GitHubResultsCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.cache_dir = Path(self.tmp.name) / "gh-results"
+        patcher = mock.patch.object(github, '_gh_results_cache_dir', return_value=self.cache_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_writing_a_result_removes_expired_entries(self):
+        self.cache_dir.mkdir()
+        stale = self.cache_dir / "stale.json"
+        fresh = self.cache_dir / "fresh.json"
+        stale.write_bytes(b'{}')
+        fresh.write_bytes(b'{}')
+        old = time.time() - github.GH_RESULTS_CACHE_TTL - 10
+        os.utime(stale, (old, old))
+
+        with mock.patch.object(github, '_github_api', return_value=b'{"data": {}}'):
+            self.assertEqual(github._github_api_cached('/graphql', body={'query': 'q'}), b'{"data": {}}')
+
+        self.assertFalse(stale.exists())
+        self.assertTrue(fresh.exists())
+        self.assertTrue(github._gh_results_cache_file('/graphql', body={'query': 'q'}).exists())
+
+    def test_cached_result_is_reused_within_ttl(self):
+        with mock.patch.object(github, '_github_api', return_value=b'{}') as api:
+            github._github_api_cached('/graphql', body={'query': 'q'})
+            github._github_api_cached('/graphql', body={'query': 'q'})
+        self.assertEqual(api.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
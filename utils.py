@@ -5,20 +5,53 @@ Common utilities for Alfred Git Open workflow.
 import os
 import json
 import sys
+import shutil
 import subprocess
 from typing import List, Dict, Any, Optional
 
+# terminal-notifier skips osascript's AppleScript compile step when installed
+_TERMINAL_NOTIFIER = shutil.which('terminal-notifier')
+
+# Full path lets subprocess launch the notifier with posix_spawn instead of fork+exec
+_OSASCRIPT = shutil.which('osascript') or 'osascript'
+
+_NOTIFICATION_SCRIPT = """on run argv
+    display notification (item 1 of argv) with title (item 2 of argv)
+end run"""
+
+def _notification_command(title: str, message: str) -> List[str]:
+    """Build a notification command that passes title and message as literal arguments."""
+    if _TERMINAL_NOTIFIER:
+        return [_TERMINAL_NOTIFIER, '-title', title, '-message', message]
+    
+    # Pass text through argv so it is never compiled as AppleScript source
+    return [_OSASCRIPT, '-e', _NOTIFICATION_SCRIPT, message, title]
+
 def show_notification(title: str, message: str) -> None:
     """Show macOS notification."""
     try:
-        cmd = [
-            'osascript', '-e',
-            f'display notification "{message}" with title "{title}"'
-        ]
-        subprocess.run(cmd, check=True)
-    except subprocess.CalledProcessError:
+        subprocess.run(_notification_command(title, message), check=True)
+    except (subprocess.CalledProcessError, OSError):
         pass  # Ignore notification failures
 
+def show_notification_async(title: str, message: str) -> None:
+    """Show macOS notification without waiting for the notifier to finish."""
+    try:
+        # close_fds=False keeps the posix_spawn fast path; Python's own fds are non-inheritable
+        subprocess.Popen(_notification_command(title, message),
+                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, close_fds=False)
+    except OSError:
+        pass  # Ignore notification failures
+
+def _spawn_open(args: List[str]) -> bool:
+    """Launch macOS `open` detached, without waiting for LaunchServices to hand off."""
+    try:
+        subprocess.Popen(['open'] + args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                         close_fds=True, start_new_session=True)
+        return True
+    except OSError:
+        return False
+
 def open_with_ide(ide_path: str, project_path: str) -> bool:
     """Open project with selected IDE or special app."""
     # Handle special cases
@@ -27,28 +60,18 @@ def open_with_ide(ide_path: str, project_path: str) -> bool:
     elif ide_path == "TERMINAL":
         return open_in_terminal(project_path)
     
-    # Handle regular IDE
-    try:
-        subprocess.run(['open', '-a', ide_path, project_path], check=True)
-        return True
-    except subprocess.CalledProcessError:
+    # Handle regular IDE; `open` is not awaited, so report a missing app up front
+    if not os.path.exists(ide_path):
         return False
+    return _spawn_open(['-a', ide_path, project_path])
 
 def open_in_finder(path: str) -> bool:
     """Open path in Finder."""
-    try:
-        subprocess.run(['open', path], check=True)
-        return True
-    except subprocess.CalledProcessError:
-        return False
+    return _spawn_open([path])
 
 def open_in_terminal(path: str) -> bool:
     """Open path in Terminal."""
-    try:
-        subprocess.run(['open', '-a', 'Terminal', path], check=True)
-        return True
-    except subprocess.CalledProcessError:
-        return False
+    return _spawn_open(['-a', 'Terminal', path])
 
 
 def ensure_directory_exists(directory: str) -> bool: